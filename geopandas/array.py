@@ -16,7 +16,7 @@ from ._compat import HAS_PYPROJ, requires_pyproj
 from .sindex import SpatialIndex
 if HAS_PYPROJ:
     from pyproj import Transformer
-    TransformerFromCRS = lru_cache(Transformer.from_crs)
+    TransformerFromCRS = lru_cache(maxsize=128)(Transformer.from_crs)
 _names = {'MISSING': None, 'NAG': None, 'POINT': 'Point', 'LINESTRING':
     'LineString', 'LINEARRING': 'LinearRing', 'POLYGON': 'Polygon',
     'MULTIPOINT': 'MultiPoint', 'MULTILINESTRING': 'MultiLineString',
@@ -134,28 +134,7 @@ def from_wkb(data, crs=None, on_invalid='raise'):
         - ignore: invalid WKB geometries will be returned as None without a warning.
 
     """
-    import shapely.wkb
-
-    if not isinstance(data, np.ndarray):
-        data = np.array(data, dtype=object)
-
-    geoms = []
-    for wkb in data:
-        try:
-            geom = shapely.wkb.loads(wkb)
-            geoms.append(geom)
-        except Exception as e:
-            if on_invalid == 'raise':
-                raise ValueError(f"Invalid WKB geometry: {e}")
-            elif on_invalid == 'warn':
-                warnings.warn(f"Invalid WKB geometry: {e}", UserWarning)
-                geoms.append(None)
-            elif on_invalid == 'ignore':
-                geoms.append(None)
-            else:
-                raise ValueError("Invalid value for on_invalid")
-
-    return GeometryArray(np.array(geoms, dtype=object), crs=crs)
+    return GeometryArray(shapely.from_wkb(data, on_invalid=on_invalid), crs=crs)
 
 
 def to_wkb(geoms, hex=False, **kwargs):
@@ -451,7 +430,22 @@ class GeometryArray(ExtensionArray):
         - Prime Meridian: Greenwich
 
         """
-        pass
+        from pyproj import CRS
+        if self.crs is None:
+            raise ValueError(
+                'Cannot transform naive geometries.  Please set a crs on the object first.'
+                )
+        if crs is not None:
+            crs = CRS.from_user_input(crs)
+        elif epsg is not None:
+            crs = CRS.from_epsg(epsg)
+        else:
+            raise ValueError('Must pass either crs or epsg.')
+        if self.crs.is_exact_same(crs):
+            return self
+        transformer = TransformerFromCRS(self.crs, crs, always_xy=True)
+        new_data = transform(self._data, transformer.transform)
+        return GeometryArray(new_data, crs=crs)
 
     @requires_pyproj
     def estimate_utm_crs(self, datum_name='WGS 84'):
@@ -509,6 +503,32 @@ class GeometryArray(ExtensionArray):
         """Return the z location of point geometries in a GeoSeries"""
         pass
 
+    @property
+    def bounds(self):
+        return shapely.bounds(self._data)
+
+    @property
+    def total_bounds(self):
+        if len(self) == 0:
+            # numpy 'min' cannot handle empty arrays
+            return np.array([np.nan, np.nan, np.nan, np.nan])
+        # reduce each column of the (N, 4) bounds with the NaN-aware
+        # reductions (missing and empty geometries have NaN bounds)
+        b = self.bounds
+        with warnings.catch_warnings():
+            # if all rows are empty geometry / none, nan is expected
+            warnings.filterwarnings(
+                "ignore", r"All-NaN slice encountered", RuntimeWarning
+            )
+            return np.array(
+                (
+                    np.nanmin(b[:, 0]),  # minx
+                    np.nanmin(b[:, 1]),  # miny
+                    np.nanmax(b[:, 2]),  # maxx
+                    np.nanmax(b[:, 3]),  # maxy
+                )
+            )
+
     def fillna(self, value=None, method=None, limit=None, copy=True):
         """
         Fill NA values with geometry (or geometries) or using the specified method.
@@ -785,3 +805,21 @@ class GeometryArray(ExtensionArray):
             else:
                 return False
         return (self == item).any()
+
+
+def transform(data, func):
+    """
+    Apply the coordinate transformation ``func(x, y[, z])`` to all
+    geometries in ``data``, working on the flat coordinate arrays.
+    """
+    has_z = shapely.has_z(data)
+    result = np.empty_like(data)
+    coords = shapely.get_coordinates(data[~has_z], include_z=False)
+    new_coords = func(coords[:, 0], coords[:, 1])
+    result[~has_z] = shapely.set_coordinates(data[~has_z].copy(), np.array(
+        new_coords).T)
+    coords_z = shapely.get_coordinates(data[has_z], include_z=True)
+    new_coords_z = func(coords_z[:, 0], coords_z[:, 1], coords_z[:, 2])
+    result[has_z] = shapely.set_coordinates(data[has_z].copy(), np.array(
+        new_coords_z).T)
+    return result
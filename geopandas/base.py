@@ -4698,7 +4698,10 @@ class GeoPandasBase(object):
         1  POLYGON ((0 0, 1 1, 1 0, 0 0))   0.0   0.0   1.0   1.0
         2           LINESTRING (0 1, 1 2)   0.0   1.0   1.0   2.0
         """
-        pass
+        bounds = GeometryArray(self.geometry.values).bounds
+        return DataFrame(
+            bounds, columns=["minx", "miny", "maxx", "maxy"], index=self.index
+        )
 
     @property
     def total_bounds(self):
@@ -4717,7 +4720,7 @@ class GeoPandasBase(object):
         >>> gdf.total_bounds
         array([ 0., -1.,  3.,  2.])
         """
-        pass
+        return GeometryArray(self.geometry.values).total_bounds
 
     @property
     def sindex(self):
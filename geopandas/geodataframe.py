@@ -915,7 +915,28 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         GeoDataFrame.to_feather : write GeoDataFrame to feather
         GeoDataFrame.to_file : write GeoDataFrame to file
         """
-        pass
+        # Accept engine keyword for compatibility with pandas.DataFrame.to_parquet
+        # The only engine currently supported by GeoPandas is pyarrow, so no
+        # other engine should be specified.
+        engine = kwargs.pop("engine", "auto")
+        if engine not in ("auto", "pyarrow"):
+            raise ValueError(
+                "GeoPandas only supports using pyarrow as the engine for "
+                f"to_parquet: {engine!r} passed instead."
+            )
+
+        from geopandas.io.arrow import _to_parquet
+
+        _to_parquet(
+            self,
+            path,
+            compression=compression,
+            geometry_encoding=geometry_encoding,
+            index=index,
+            schema_version=schema_version,
+            write_covering_bbox=write_covering_bbox,
+            **kwargs,
+        )
 
     def to_feather(self, path, index=None, compression=None, schema_version
         =None, **kwargs):
@@ -956,7 +977,16 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         GeoDataFrame.to_parquet : write GeoDataFrame to parquet
         GeoDataFrame.to_file : write GeoDataFrame to file
         """
-        pass
+        from geopandas.io.arrow import _to_feather
+
+        _to_feather(
+            self,
+            path,
+            index=index,
+            compression=compression,
+            schema_version=schema_version,
+            **kwargs,
+        )
 
     def to_file(self, filename, driver=None, schema=None, index=None, **kwargs
         ):
@@ -1130,7 +1160,13 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         GeoDataFrame.to_crs : re-project to another CRS
 
         """
-        pass
+        if not inplace:
+            df = self.copy()
+        else:
+            df = self
+        df.geometry = df.geometry.set_crs(crs=crs, epsg=epsg,
+            allow_override=allow_override, inplace=True)
+        return df
 
     def to_crs(self, crs=None, epsg=None, inplace=False):
         """Transform geometries to a new coordinate reference system.
@@ -1208,7 +1244,14 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         --------
         GeoDataFrame.set_crs : assign CRS without re-projection
         """
-        pass
+        if inplace:
+            df = self
+        else:
+            df = self.copy()
+        geom = df.geometry.to_crs(crs=crs, epsg=epsg)
+        df.geometry = geom
+        if not inplace:
+            return df
 
     def estimate_utm_crs(self, datum_name='WGS 84'):
         """Returns the estimated UTM CRS based on the bounds of the dataset.
@@ -1255,17 +1298,22 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         return a GeoDataFrame.
         """
         result = super().__getitem__(key)
-        if pd.api.types.is_scalar(key) and key == '' and isinstance(self.
-            columns, pd.MultiIndex) and isinstance(result, Series
-            ) and not is_geometry_type(result):
+        if isinstance(result, Series):
+            if isinstance(result.dtype, GeometryDtype):
+                result.__class__ = GeoSeries
+                return result
+            if not (isinstance(self.columns, pd.MultiIndex) and isinstance(
+                key, str) and key == ''):
+                return result
             loc = self.columns.get_loc(key)
             result = self.iloc[:, loc].squeeze(axis='columns')
-        geo_col = self._geometry_column_name
-        if isinstance(result, Series) and isinstance(result.dtype,
-            GeometryDtype):
-            result.__class__ = GeoSeries
+        if isinstance(result, Series):
+            if isinstance(result.dtype, GeometryDtype):
+                result.__class__ = GeoSeries
         elif isinstance(result, DataFrame):
-            if (result.dtypes == 'geometry').sum() > 0:
+            geo_col = self._geometry_column_name
+            if any(isinstance(dtype, GeometryDtype) for dtype in result.
+                dtypes):
                 result.__class__ = GeoDataFrame
                 if geo_col in result:
                     result._geometry_column_name = geo_col
@@ -1286,15 +1334,22 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         if not pd.api.types.is_list_like(key) and (key == self.
             _geometry_column_name or key == 'geometry' and self.
             _geometry_column_name is None):
-            if pd.api.types.is_scalar(value) or isinstance(value, BaseGeometry
-                ):
-                value = [value] * self.shape[0]
+            if self._geometry_column_name is not None:
+                crs = getattr(self, 'crs', None)
+            else:
+                crs = None
+            if isinstance(value, BaseGeometry):
+                arr = np.empty(self.shape[0], dtype=object)
+                arr.fill(value)
+                value = GeometryArray(arr, crs=crs)
+                broadcast = True
+            else:
+                if pd.api.types.is_scalar(value):
+                    value = [value] * self.shape[0]
+                broadcast = False
             try:
-                if self._geometry_column_name is not None:
-                    crs = getattr(self, 'crs', None)
-                else:
-                    crs = None
-                value = _ensure_geometry(value, crs=crs)
+                if not broadcast:
+                    value = _ensure_geometry(value, crs=crs)
                 if key == 'geometry':
                     self._persist_old_default_geometry_colname()
             except TypeError:
@@ -1502,7 +1557,24 @@ Please ensure this column from the first DataFrame is not repeated."""
         -------
         GeoDataFrame or DataFrame
         """
-        pass
+        if not PANDAS_GE_30 and copy is None:
+            copy = True
+        if copy is not None:
+            kwargs['copy'] = copy
+        df = super().astype(dtype, errors=errors, **kwargs)
+        geo_col = self._geometry_column_name
+        if isinstance(dtype, dict
+            ) and geo_col is not None and geo_col in self and geo_col not in dtype:
+            df.__class__ = GeoDataFrame
+            df._geometry_column_name = geo_col
+            return df
+        try:
+            geoms = df[geo_col]
+            if is_geometry_type(geoms):
+                return geopandas.GeoDataFrame(df, geometry=geo_col)
+        except KeyError:
+            pass
+        return pd.DataFrame(df)
 
     def to_postgis(self, name, con, schema=None, if_exists='fail', index=
         False, index_label=None, chunksize=None, dtype=None):
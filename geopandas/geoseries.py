@@ -469,7 +469,9 @@ class GeoSeries(GeoPandasBase, Series):
         GeoSeries
 
         """
-        pass
+        from geopandas.io._geoarrow import arrow_to_geometry_array
+
+        return cls(arrow_to_geometry_array(arr), **kwargs)
 
     @property
     def __geo_interface__(self) ->Dict:
@@ -873,7 +875,21 @@ class GeoSeries(GeoPandasBase, Series):
         GeoSeries.to_crs : re-project to another CRS
 
         """
-        pass
+        if crs is None and epsg is not None:
+            crs = epsg
+        if not allow_override and self.crs is not None and not self.crs == crs:
+            raise ValueError(
+                "The GeoSeries already has a CRS which is not equal to the passed "
+                "CRS. Specify 'allow_override=True' to allow replacing the existing "
+                "CRS without doing any transformation. If you actually want to "
+                "transform the geometries, use 'GeoSeries.to_crs' instead."
+            )
+        if not inplace:
+            result = self.copy()
+        else:
+            result = self
+        result.array.crs = crs
+        return result
 
     def to_crs(self, crs: Optional[Any]=None, epsg: Optional[int]=None
         ) ->GeoSeries:
@@ -952,7 +968,8 @@ class GeoSeries(GeoPandasBase, Series):
         GeoSeries.set_crs : assign CRS
 
         """
-        pass
+        return GeoSeries(self.values.to_crs(crs=crs, epsg=epsg), index=self.
+            index, name=self.name)
 
     def estimate_utm_crs(self, datum_name: str='WGS 84'):
         """Returns the estimated UTM CRS based on the bounds of the dataset.
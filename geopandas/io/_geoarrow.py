@@ -9,9 +9,12 @@ import shapely
 from shapely import GeometryType
 from geopandas import GeoDataFrame
 from geopandas._compat import SHAPELY_GE_204
-from geopandas.array import from_shapely, from_wkb
-GEOARROW_ENCODINGS = ['point', 'linestring', 'polygon', 'multipoint',
-    'multilinestring', 'multipolygon']
+from geopandas.array import GeometryArray, from_wkb
+from geopandas.io.arrow import GEOARROW_ENCODINGS
+_ENCODE_CHUNKSIZE = 65536
+_Z_SAMPLE_SIZE = 1024
+_NESTING_LEVELS = {'point': 0, 'linestring': 1, 'polygon': 2, 'multipoint':
+    1, 'multilinestring': 2, 'multipolygon': 3}
 
 
 class ArrowTable:
@@ -108,47 +111,134 @@ def geopandas_to_arrow(df, index=None, geometry_encoding='WKB', interleaved
     if index is None:
         index = not isinstance(df.index, pd.RangeIndex)
     
-    # Convert DataFrame to Arrow table
-    table = pa.Table.from_pandas(df, preserve_index=index)
-    
     # Handle geometry column
-    geom_col = df.geometry.name
-    geom_array = df.geometry.values
-    
+    geom_col = df._geometry_column_name
+    geom_array = df[geom_col].values
+    geoms = np.asarray(geom_array)
+
+    # Convert the other columns to an Arrow table, with a placeholder for the
+    # geometry column (converted to an Arrow null column, which keeps it in
+    # the pandas schema metadata); the geometries are encoded separately
+    # below (no need to let pyarrow convert the objects)
+    df_attr = pd.DataFrame(df.copy(deep=False))
+    df_attr[geom_col] = None
+    table = pa.Table.from_pandas(df_attr, preserve_index=index)
+    geom_position = table.schema.get_field_index(geom_col)
+
     if geometry_encoding == 'WKB':
-        wkb_array = pa.array(geom_array.to_wkb())
         field = pa.field(geom_col, pa.binary())
-        table = table.set_column(table.schema.get_field_index(geom_col), field, wkb_array)
+        table = table.set_column(geom_position, field, wkb_to_arrow(geoms))
     elif geometry_encoding == 'geoarrow':
-        if include_z is None:
-            include_z = geom_array.has_z.any()
-        
-        coord_type = pa.float64()
-        if interleaved:
-            coords = [g.coords[:] for g in geom_array]
-            if include_z:
-                coords_array = pa.list_(pa.list_(coord_type, 3))
-            else:
-                coords_array = pa.list_(pa.list_(coord_type, 2))
-            coords_array = pa.array(coords, type=coords_array)
-        else:
-            x, y = zip(*[(c[0], c[1]) for g in geom_array for c in g.coords])
-            if include_z:
-                z = [c[2] if len(c) > 2 else float('nan') for g in geom_array for c in g.coords]
-                coords_array = pa.StructArray.from_arrays([pa.array(x), pa.array(y), pa.array(z)], ['x', 'y', 'z'])
-            else:
-                coords_array = pa.StructArray.from_arrays([pa.array(x), pa.array(y)], ['x', 'y'])
-        
-        geom_type = pa.array([g.geom_type for g in geom_array], pa.string())
-        field = pa.field(geom_col, pa.struct([('type', pa.string()), ('coordinates', coords_array.type)]))
-        geoarrow_array = pa.StructArray.from_arrays([geom_type, coords_array], ['type', 'coordinates'])
-        table = table.set_column(table.schema.get_field_index(geom_col), field, geoarrow_array)
+        if not SHAPELY_GE_204:
+            raise ImportError(
+                "The 'geoarrow' encoding requires shapely >= 2.0.4"
+            )
+        field, geoarrow_array = construct_geometry_array(
+            geoms,
+            include_z=include_z,
+            field_name=geom_col,
+            crs=df.crs,
+            interleaved=interleaved,
+        )
+        table = table.set_column(geom_position, field, geoarrow_array)
     else:
         raise ValueError("Invalid geometry_encoding. Must be 'WKB' or 'geoarrow'")
     
     return table
 
 
+def wkb_to_arrow(geoms):
+    """
+    Encode a NumPy array of shapely geometries as a (chunked) Arrow binary
+    array of WKB.
+    """
+    # encode the geometries with vectorized calls per chunk, so only the
+    # WKB bytes objects of a single chunk are alive at the same time;
+    # pyarrow copies them (incl. nulls for missing geometries) in C
+    # (GeoArrow and GeoParquet require ISO WKB for 3D geometries, older
+    # shapely versions can only write the extended WKB flavor)
+    kwargs = {'flavor': 'iso'} if SHAPELY_GE_204 else {}
+    return pa.chunked_array(
+        [pa.array(shapely.to_wkb(geoms[i:i + _ENCODE_CHUNKSIZE], **kwargs),
+                  type=pa.binary())
+         for i in range(0, len(geoms), _ENCODE_CHUNKSIZE)],
+        type=pa.binary(),
+    )
+
+
+def _build_coords(coords, interleaved):
+    """
+    Build the point level Arrow array from a (N, 2|3) coordinates array.
+    """
+    if interleaved:
+        return pa.FixedSizeListArray.from_arrays(
+            pa.array(coords.ravel(), type=pa.float64()), coords.shape[1]
+        )
+    else:
+        # one contiguous array per dimension
+        names = ['x', 'y', 'z'][:coords.shape[1]]
+        return pa.StructArray.from_arrays(
+            [pa.array(np.ascontiguousarray(coords[:, i]), type=pa.float64())
+             for i in range(len(names))],
+            names,
+        )
+
+
+def construct_geometry_array(shapely_arr, include_z=None, field_name='geometry',
+    crs=None, interleaved=True):
+    """
+    Construct the native GeoArrow encoding of an array of shapely
+    geometries of a single geometry type.
+
+    Returns the field (with the GeoArrow extension name and metadata set
+    in the field metadata, so no extension type needs to be registered
+    with pyarrow) and the storage array.
+    """
+    if include_z is None:
+        # a single 3D geometry is enough to include z, which for 3D data is
+        # decided by the first geometries already; only scan the full array
+        # if none of those has z (a prefix without z does not prove the rest
+        # is 2D)
+        include_z = bool(
+            shapely.has_z(shapely_arr[:_Z_SAMPLE_SIZE]).any()
+            or shapely.has_z(shapely_arr[_Z_SAMPLE_SIZE:]).any()
+        )
+    geom_type, coords, offsets = shapely.to_ragged_array(
+        shapely_arr, include_z=include_z
+    )
+    mask = shapely.is_missing(shapely_arr)
+
+    arr = _build_coords(coords, interleaved)
+    if offsets:
+        # wrap the coordinates in the nested lists, innermost level first
+        for i, level_offsets in enumerate(offsets):
+            outer = i == len(offsets) - 1
+            arr = pa.ListArray.from_arrays(
+                pa.array(level_offsets.astype(np.int32)),
+                arr,
+                mask=pa.array(mask) if outer and mask.any() else None,
+            )
+    elif mask.any():
+        validity = pa.py_buffer(np.packbits(~mask, bitorder='little'))
+        if interleaved:
+            children = [arr.values]
+        else:
+            children = arr.flatten()
+        arr = pa.Array.from_buffers(
+            arr.type, len(arr), [validity], children=children
+        )
+
+    extension_metadata = {
+        'ARROW:extension:name': f'geoarrow.{geom_type.name.lower()}',
+        'ARROW:extension:metadata': json.dumps(
+            {'crs': crs.to_json_dict()} if crs is not None else {}
+        ),
+    }
+    field = pa.field(field_name, arr.type, nullable=True,
+        metadata=extension_metadata)
+    return field, arr
+
+
 def arrow_to_geopandas(table, geometry=None):
     """
     Convert Arrow table object to a GeoDataFrame based on GeoArrow extension types.
@@ -169,52 +259,39 @@ def arrow_to_geopandas(table, geometry=None):
     if not isinstance(table, pa.Table):
         raise ValueError("Input must be a pyarrow.Table")
 
-    # Convert Arrow table to pandas DataFrame
-    df = table.to_pandas()
-
-    # Find geometry column
+    # Find geometry column (the first one if not specified)
     if geometry is None:
-        geometry_columns = [field.name for field in table.schema if 
-                            isinstance(field.type, pa.BinaryType) or 
-                            (isinstance(field.type, pa.StructType) and 'type' in field.type.names and 'coordinates' in field.type.names)]
-        if not geometry_columns:
+        for field in table.schema:
+            extension_name = _get_extension_name(field)
+            if extension_name is not None or _is_geometry_storage(field.type):
+                break
+        else:
             raise ValueError("No geometry column found in the Arrow table")
-        geometry = geometry_columns[0]
+        geometry = field.name
     elif geometry not in table.column_names:
         raise ValueError(f"Specified geometry column '{geometry}' not found in the Arrow table")
+    else:
+        field = table.schema.field(geometry)
+        extension_name = _get_extension_name(field)
+
+    # Convert the other columns to a pandas DataFrame (the geometry column
+    # is decoded directly from the Arrow buffers, so it is not materialized
+    # as Python objects first)
+    geom_position = table.schema.get_field_index(geometry)
+    df = table.remove_column(geom_position).to_pandas()
 
     # Convert geometry column
-    if isinstance(table.field(geometry).type, pa.BinaryType):
-        # WKB encoding
-        df[geometry] = from_wkb(df[geometry])
-    elif isinstance(table.field(geometry).type, pa.StructType):
-        # GeoArrow encoding
-        geom_array = table[geometry]
-        geom_type = geom_array.field('type').to_pylist()
-        coords = geom_array.field('coordinates').to_pylist()
-        
-        geometries = []
-        for gtype, coord in zip(geom_type, coords):
-            if gtype == 'Point':
-                geometries.append(shapely.Point(coord[0]))
-            elif gtype == 'LineString':
-                geometries.append(shapely.LineString(coord))
-            elif gtype == 'Polygon':
-                geometries.append(shapely.Polygon(coord[0], coord[1:]))
-            elif gtype == 'MultiPoint':
-                geometries.append(shapely.MultiPoint(coord))
-            elif gtype == 'MultiLineString':
-                geometries.append(shapely.MultiLineString(coord))
-            elif gtype == 'MultiPolygon':
-                geometries.append(shapely.MultiPolygon([shapely.Polygon(p[0], p[1:]) for p in coord]))
-            else:
-                raise ValueError(f"Unsupported geometry type: {gtype}")
-        
-        df[geometry] = from_shapely(geometries)
-    else:
-        raise ValueError(f"Unsupported geometry encoding for column '{geometry}'")
+    df.insert(
+        geom_position,
+        geometry,
+        _arrow_to_geometry_array(table.column(geometry), extension_name),
+    )
+
+    crs = None
+    if field.metadata and b'ARROW:extension:metadata' in field.metadata:
+        crs = json.loads(field.metadata[b'ARROW:extension:metadata']).get('crs')
 
-    return GeoDataFrame(df, geometry=geometry)
+    return GeoDataFrame(df, geometry=geometry, crs=crs)
 
 
 def arrow_to_geometry_array(arr):
@@ -224,36 +301,126 @@ def arrow_to_geometry_array(arr):
 
     Specifically for GeoSeries.from_arrow.
     """
-    if isinstance(arr, pa.BinaryArray):
+    if isinstance(arr, pa.ChunkedArray):
+        return _arrow_to_geometry_array(arr, _get_extension_name(
+            pa.field('geometry', arr.type)))
+    if Version(pa.__version__) < Version('14.0.0'):
+        raise ValueError('Importing from Arrow requires pyarrow >= 14.0.')
+
+    # import through the Arrow PyCapsule Protocol, which accepts any object
+    # with an ``__arrow_c_array__`` method and keeps the field metadata (the
+    # GeoArrow extension name is stored there if the extension type is not
+    # registered with pyarrow, e.g. for the arrays from GeoSeries.to_arrow)
+    schema_capsule, array_capsule = arr.__arrow_c_array__()
+    field = pa.Field._import_from_c_capsule(schema_capsule)
+    pa_arr = pa.Array._import_from_c_capsule(field.__arrow_c_schema__(),
+        array_capsule)
+    return _arrow_to_geometry_array(pa_arr, _get_extension_name(field))
+
+
+def _get_extension_name(field):
+    """
+    Get the GeoArrow extension name of a field, either from a registered
+    extension type or from the field metadata (None if not set).
+    """
+    if isinstance(field.type, pa.ExtensionType):
+        name = field.type.extension_name
+    elif field.metadata and b'ARROW:extension:name' in field.metadata:
+        name = field.metadata[b'ARROW:extension:name'].decode()
+    else:
+        return None
+    return name if name.startswith('geoarrow.') else None
+
+
+def _is_geometry_storage(typ):
+    """
+    Check if an Arrow type without GeoArrow extension name holds
+    geometries (WKB or the struct (type, coordinates) encoding).
+    """
+    if pa.types.is_binary(typ) or pa.types.is_large_binary(typ):
+        return True
+    return pa.types.is_struct(typ) and {'type', 'coordinates'} <= {
+        typ.field(i).name for i in range(typ.num_fields)}
+
+
+def _arrow_to_geometry_array(arr, extension_name):
+    if isinstance(arr, pa.ChunkedArray):
+        if arr.num_chunks == 1:
+            arr = arr.chunk(0)
+        elif arr.num_chunks > 1:
+            # decode chunk by chunk and concatenate the resulting arrays of
+            # geometry objects, instead of first concatenating (copying) all
+            # Arrow buffers of the chunks
+            return GeometryArray(np.concatenate([
+                _arrow_to_geometry_array(chunk, extension_name)._data
+                for chunk in arr.chunks
+            ]))
+        else:
+            arr = arr.combine_chunks()
+    if isinstance(arr, pa.ExtensionArray):
+        arr = arr.storage
+    if extension_name is not None and extension_name != 'geoarrow.wkb':
+        # native GeoArrow encoding, with a single geometry type
+        return GeometryArray(
+            construct_shapely_array(arr, extension_name[len('geoarrow.'):])
+        )
+    elif pa.types.is_binary(arr.type) or pa.types.is_large_binary(arr.type):
         # WKB encoding
-        return from_wkb(arr.to_pylist())
-    elif isinstance(arr, pa.StructArray):
-        # GeoArrow encoding
-        geom_type = arr.field('type').to_pylist()
-        coords = arr.field('coordinates').to_pylist()
-        
-        geometries = []
-        for gtype, coord in zip(geom_type, coords):
-            if gtype == 'Point':
-                geometries.append(shapely.Point(coord[0]))
-            elif gtype == 'LineString':
-                geometries.append(shapely.LineString(coord))
-            elif gtype == 'Polygon':
-                geometries.append(shapely.Polygon(coord[0], coord[1:]))
-            elif gtype == 'MultiPoint':
-                geometries.append(shapely.MultiPoint(coord))
-            elif gtype == 'MultiLineString':
-                geometries.append(shapely.MultiLineString(coord))
-            elif gtype == 'MultiPolygon':
-                geometries.append(shapely.MultiPolygon([shapely.Polygon(p[0], p[1:]) for p in coord]))
-            else:
-                raise ValueError(f"Unsupported geometry type: {gtype}")
-        
-        return from_shapely(geometries)
+        return from_wkb(arr.to_numpy(zero_copy_only=False))
+    elif _is_geometry_storage(arr.type):
+        # struct (type, coordinates) encoding
+        return GeometryArray(_struct_to_shapely(arr))
     else:
         raise ValueError("Unsupported Arrow array type for geometry conversion")
 
 
+def _struct_to_shapely(arr):
+    """
+    Construct a NumPy array of shapely geometries from the struct
+    (``type``, ``coordinates``) encoding.
+
+    The rows are grouped by geometry type, so that the geometries of each
+    type are created with a single vectorized call.
+    """
+    geom_type = arr.field('type').dictionary_encode()
+    codes = np.asarray(geom_type.indices.fill_null(-1))
+    coords = arr.field('coordinates')
+
+    result = np.full(len(arr), None, dtype=object)
+    for code, gtype in enumerate(geom_type.dictionary.to_pylist()):
+        idx = np.flatnonzero(codes == code)
+        if len(idx) == len(arr):
+            # single geometry type, use the coordinates buffers as is
+            subset = coords
+        else:
+            subset = coords.take(pa.array(idx))
+        if gtype == 'Point':
+            result[idx] = construct_shapely_array(subset.flatten(), 'point')
+        elif gtype.lower() in GEOARROW_ENCODINGS:
+            result[idx] = construct_shapely_array(subset, gtype.lower())
+        else:
+            raise ValueError(f"Unsupported geometry type: {gtype}")
+    return result
+
+
+def _get_inner_coords(arr):
+    """
+    Get the (N, 2|3) coordinates array from the innermost (point level)
+    array of a GeoArrow nested array.
+    """
+    if pa.types.is_struct(arr.type):
+        # separated coordinates, written column by column into a single
+        # preallocated interleaved buffer
+        children = arr.flatten()
+        coords = np.empty((len(arr), len(children)), dtype=np.float64)
+        for i, child in enumerate(children):
+            coords[:, i] = np.asarray(child)
+        return coords
+    else:
+        # interleaved coordinates (zero-copy view on the values buffer)
+        return np.asarray(arr.flatten()).reshape(-1, arr.type.list_size)
+
+
 def construct_shapely_array(arr: pa.Array, extension_name: str):
     """
     Construct a NumPy array of shapely geometries from a pyarrow.Array
@@ -266,22 +433,24 @@ def construct_shapely_array(arr: pa.Array, extension_name: str):
     if extension_name not in GEOARROW_ENCODINGS:
         raise ValueError(f"Unsupported GeoArrow encoding: {extension_name}")
 
+    if isinstance(arr, pa.ExtensionArray):
+        arr = arr.storage
+
     geom_type = GeometryType[extension_name.upper()]
-    coords = arr.field('coordinates').to_pylist()
-
-    geometries = []
-    for coord in coords:
-        if geom_type == GeometryType.POINT:
-            geometries.append(shapely.Point(coord))
-        elif geom_type == GeometryType.LINESTRING:
-            geometries.append(shapely.LineString(coord))
-        elif geom_type == GeometryType.POLYGON:
-            geometries.append(shapely.Polygon(coord[0], coord[1:]))
-        elif geom_type == GeometryType.MULTIPOINT:
-            geometries.append(shapely.MultiPoint(coord))
-        elif geom_type == GeometryType.MULTILINESTRING:
-            geometries.append(shapely.MultiLineString(coord))
-        elif geom_type == GeometryType.MULTIPOLYGON:
-            geometries.append(shapely.MultiPolygon([shapely.Polygon(p[0], p[1:]) for p in coord]))
-
-    return np.array(geometries, dtype=object)
+
+    # collect the flat coordinates and the offsets of every nesting level
+    # (innermost first), so all geometries are created in a single call
+    offsets = []
+    inner = arr
+    for _ in range(_NESTING_LEVELS[extension_name]):
+        offsets.insert(0, np.asarray(inner.offsets))
+        inner = inner.values
+    coords = _get_inner_coords(inner)
+
+    result = shapely.from_ragged_array(geom_type, coords, tuple(offsets) or None)
+
+    # missing geometries
+    if arr.null_count:
+        result = np.where(np.asarray(arr.is_null()), None, result)
+
+    return result
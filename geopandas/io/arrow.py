@@ -1,5 +1,9 @@
 import json
+import os
+import threading
+import time
 import warnings
+from collections import OrderedDict
 from packaging.version import Version
 import numpy as np
 from pandas import DataFrame, Series
@@ -7,8 +11,13 @@ import shapely
 import geopandas
 from geopandas import GeoDataFrame
 from geopandas._compat import import_optional_dependency
-from geopandas.array import from_shapely, from_wkb
+from geopandas.array import GeometryDtype, from_shapely, from_wkb
 from .file import _expand_user
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 METADATA_VERSION = '1.0.0'
 SUPPORTED_VERSIONS = ['0.1.0', '0.4.0', '1.0.0-beta.1', '1.0.0', '1.1.0']
 GEOARROW_ENCODINGS = ['point', 'linestring', 'polygon', 'multipoint',
@@ -26,22 +35,24 @@ def _remove_id_from_member_of_ensembles(json_dict):
 
     Mimicking the patch to GDAL from https://github.com/OSGeo/gdal/pull/5872
     """
-    if isinstance(json_dict, dict):
-        if "datum" in json_dict:
-            datum = json_dict["datum"]
-            if isinstance(datum, dict) and "ensemble" in datum:
-                ensemble = datum["ensemble"]
-                if isinstance(ensemble, dict) and "members" in ensemble:
-                    members = ensemble["members"]
+    # walk the (arbitrarily nested) PROJJSON document with an explicit stack
+    # instead of recursing into every dict and list
+    stack = [json_dict]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            datum = node.get("datum")
+            if isinstance(datum, dict):
+                ensemble = datum.get("ensemble")
+                if isinstance(ensemble, dict):
+                    members = ensemble.get("members")
                     if isinstance(members, list):
                         for member in members:
                             if isinstance(member, dict):
                                 member.pop("id", None)
-        for value in json_dict.values():
-            _remove_id_from_member_of_ensembles(value)
-    elif isinstance(json_dict, list):
-        for item in json_dict:
-            _remove_id_from_member_of_ensembles(item)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
 
 
 _geometry_type_names = ['Point', 'LineString', 'LineString', 'Polygon',
@@ -54,7 +65,27 @@ def _get_geometry_types(series):
     """
     Get unique geometry types from a GeoSeries.
     """
-    return list(series.geom_type.unique())
+    arr = series.array._data
+    type_ids = shapely.get_type_id(arr)
+    # ensure to include "... Z" for 3D geometries
+    type_ids[shapely.has_z(arr)] += 8
+
+    # drop missing values (shapely.get_type_id returns -1 for those)
+    unique_ids = np.unique(type_ids)
+    return sorted(_geometry_type_names[idx] for idx in unique_ids if idx >= 0)
+
+
+def _get_total_bounds(series):
+    """
+    Get the total bounds of a GeoSeries as a list of floats (missing and
+    empty geometries are ignored).
+
+    The bounds of a series without any non-empty geometry are NaN, which is
+    not valid JSON; those are returned as None, so they are written as null
+    by both orjson and the stdlib json module.
+    """
+    bounds = series.array.total_bounds
+    return [None if np.isnan(b) else b for b in bounds.tolist()]
 
 
 def _create_metadata(df, schema_version=None, geometry_encoding=None,
@@ -82,7 +113,9 @@ def _create_metadata(df, schema_version=None, geometry_encoding=None,
     if schema_version not in SUPPORTED_VERSIONS:
         raise ValueError(f"Unsupported schema version: {schema_version}")
     
-    geometry_columns = df.select_dtypes(include=['geometry']).columns
+    geometry_columns = [
+        col for col, dtype in df.dtypes.items() if isinstance(dtype, GeometryDtype)
+    ]
     if len(geometry_columns) == 0:
         raise ValueError("No geometry column found in GeoDataFrame")
     
@@ -94,18 +127,40 @@ def _create_metadata(df, schema_version=None, geometry_encoding=None,
         "columns": {}
     }
     
+    if not isinstance(geometry_encoding, dict):
+        geometry_encoding = dict.fromkeys(geometry_columns, geometry_encoding or "WKB")
+
+    # geometry columns commonly share the same CRS object, so export each
+    # CRS to WKT (a round-trip through PROJ) only once
+    crs_wkt = {}
+
     for col in geometry_columns:
+        series = df[col]
         col_metadata = {
-            "encoding": geometry_encoding or "WKB",
-            "geometry_types": _get_geometry_types(df[col])
+            "encoding": geometry_encoding[col],
+            "geometry_types": _get_geometry_types(series)
         }
         
-        if df[col].crs:
-            col_metadata["crs"] = df[col].crs.to_wkt()
+        # always write the key: a missing "crs" is read back as OGC:CRS84
+        crs = series.crs
+        if crs:
+            if id(crs) not in crs_wkt:
+                crs_wkt[id(crs)] = crs.to_wkt()
+            col_metadata["crs"] = crs_wkt[id(crs)]
+        else:
+            col_metadata["crs"] = None
         
         if write_covering_bbox:
-            bounds = df[col].total_bounds
-            col_metadata["bbox"] = [bounds[0], bounds[1], bounds[2], bounds[3]]
+            col_metadata["bbox"] = _get_total_bounds(series)
+            if col == primary_geometry:
+                col_metadata["covering"] = {
+                    "bbox": {
+                        "xmin": ["bbox", "xmin"],
+                        "ymin": ["bbox", "ymin"],
+                        "xmax": ["bbox", "xmax"],
+                        "ymax": ["bbox", "ymax"],
+                    },
+                }
         
         metadata["columns"][col] = col_metadata
     
@@ -123,7 +178,10 @@ def _encode_metadata(metadata):
     -------
     UTF-8 encoded JSON string
     """
-    pass
+    if orjson is not None:
+        # the bbox values can be numpy scalars
+        return orjson.dumps(metadata, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(metadata).encode("utf-8")
 
 
 def _decode_metadata(metadata_str):
@@ -137,7 +195,18 @@ def _decode_metadata(metadata_str):
     -------
     dict
     """
-    pass
+    if metadata_str is None:
+        return None
+
+    if orjson is not None:
+        try:
+            return orjson.loads(metadata_str)
+        except orjson.JSONDecodeError:
+            # metadata written by the stdlib json module can contain NaN,
+            # which orjson does not accept; malformed metadata raises from
+            # the stdlib parser below
+            pass
+    return json.loads(metadata_str.decode("utf-8"))
 
 
 def _validate_dataframe(df):
@@ -152,7 +221,19 @@ def _validate_dataframe(df):
     ----------
     df : GeoDataFrame
     """
-    pass
+    if not isinstance(df, DataFrame):
+        raise ValueError("Writing to Parquet/Feather only supports IO with DataFrames")
+
+    # must have value column names (strings only)
+    if df.columns.inferred_type not in {"string", "unicode", "empty"}:
+        raise ValueError("Writing to Parquet/Feather requires string column names")
+
+    # index level names must be strings
+    valid_names = all(
+        isinstance(name, str) for name in df.index.names if name is not None
+    )
+    if not valid_names:
+        raise ValueError("Index level names must be strings")
 
 
 def _validate_geo_metadata(metadata):
@@ -165,7 +246,63 @@ def _validate_geo_metadata(metadata):
     ----------
     metadata : dict
     """
-    pass
+    if not metadata:
+        raise ValueError("Missing or malformed geo metadata in Parquet/Feather file")
+
+    # version was schema_version in 0.1.0
+    version = metadata.get("version", metadata.get("schema_version"))
+    if not version:
+        raise ValueError(
+            "'geo' metadata in Parquet/Feather file is missing required key: "
+            "'version'"
+        )
+
+    required_keys = ("primary_column", "columns")
+    for key in required_keys:
+        if metadata.get(key, None) is None:
+            raise ValueError(
+                "'geo' metadata in Parquet/Feather file is missing required key: "
+                "'{key}'".format(key=key)
+            )
+
+    if not isinstance(metadata["columns"], dict):
+        raise ValueError("'columns' in 'geo' metadata must be a dict")
+
+    # Validate that geometry columns have required metadata and values
+    # leaving out "geometry_type" for compatibility with 0.1
+    required_col_keys = ("encoding",)
+    for col, column_metadata in metadata["columns"].items():
+        for key in required_col_keys:
+            if key not in column_metadata:
+                raise ValueError(
+                    "'geo' metadata in Parquet/Feather file is missing required key "
+                    "'{key}' for column '{col}'".format(key=key, col=col)
+                )
+
+        if column_metadata["encoding"] not in SUPPORTED_ENCODINGS:
+            raise ValueError(
+                "Only WKB geometry encoding or one of the native encodings "
+                f"({GEOARROW_ENCODINGS!r}) are supported, "
+                f"got: {column_metadata['encoding']}"
+            )
+
+        if column_metadata.get("edges", "planar") == "spherical":
+            warnings.warn(
+                f"The geo metadata indicate that column '{col}' has spherical edges, "
+                "but because GeoPandas currently does not support spherical "
+                "geometry, it ignores this metadata and will interpret the edges of "
+                "the geometries as planar.",
+                UserWarning,
+                stacklevel=4,
+            )
+
+        if "covering" in column_metadata:
+            covering = column_metadata["covering"]
+            if "bbox" in covering:
+                bbox = covering["bbox"]
+                for var in ["xmin", "ymin", "xmax", "ymax"]:
+                    if var not in bbox.keys():
+                        raise ValueError("Metadata for bbox column is malformed.")
 
 
 def _geopandas_to_arrow(df, index=None, geometry_encoding='WKB',
@@ -173,7 +310,78 @@ def _geopandas_to_arrow(df, index=None, geometry_encoding='WKB',
     """
     Helper function with main, shared logic for to_parquet/to_feather.
     """
-    pass
+    import pyarrow as pa
+
+    from geopandas.io._geoarrow import construct_geometry_array, wkb_to_arrow
+
+    _validate_dataframe(df)
+
+    if schema_version is not None:
+        if geometry_encoding != "WKB" and schema_version != "1.1.0":
+            raise ValueError(
+                "'geoarrow' encoding is only supported with schema version >= 1.1.0"
+            )
+    if geometry_encoding not in ("WKB", "geoarrow"):
+        raise ValueError(
+            "Expected geometry_encoding to be one of 'WKB' or 'geoarrow', "
+            f"got {geometry_encoding!r}"
+        )
+
+    if write_covering_bbox and "bbox" in df.columns:
+        raise ValueError(
+            "An existing column 'bbox' already exists in the dataframe. "
+            "Please rename to write covering bbox."
+        )
+
+    geometry_columns = [
+        col for col, dtype in df.dtypes.items() if isinstance(dtype, GeometryDtype)
+    ]
+
+    # replace the geometry columns with dummy values, which get converted to
+    # Arrow null columns (not holding any memory); the geometries are encoded
+    # directly from the shapely arrays below
+    df_attr = DataFrame(df.copy(deep=False))
+    for col in geometry_columns:
+        df_attr[col] = None
+    table = pa.Table.from_pandas(df_attr, preserve_index=index)
+
+    geometry_encoding_dict = {}
+    for col in geometry_columns:
+        geoms = np.asarray(df[col].array)
+        if geometry_encoding == "WKB":
+            field = pa.field(col, pa.binary())
+            geom_arr = wkb_to_arrow(geoms)
+            geometry_encoding_dict[col] = "WKB"
+        else:
+            field, geom_arr = construct_geometry_array(
+                geoms, field_name=col, crs=df[col].crs, interleaved=False
+            )
+            geometry_encoding_dict[col] = (
+                field.metadata[b"ARROW:extension:name"].decode().split(".")[1]
+            )
+        table = table.set_column(table.schema.get_field_index(col), field, geom_arr)
+
+    geo_metadata = _create_metadata(
+        df,
+        schema_version=schema_version,
+        geometry_encoding=geometry_encoding_dict,
+        write_covering_bbox=write_covering_bbox,
+    )
+
+    if write_covering_bbox:
+        bounds = shapely.bounds(np.asarray(df.geometry.array))
+        bbox_array = pa.StructArray.from_arrays(
+            [pa.array(np.ascontiguousarray(bounds[:, i])) for i in range(4)],
+            names=["xmin", "ymin", "xmax", "ymax"],
+        )
+        table = table.append_column("bbox", bbox_array)
+
+    # Store geopandas specific file-level metadata
+    # This must be done AFTER creating the table or it is not persisted
+    metadata = table.schema.metadata
+    metadata.update({b"geo": _encode_metadata(geo_metadata)})
+
+    return table.replace_schema_metadata(metadata)
 
 
 def _to_parquet(df, path, index=None, compression='snappy',
@@ -217,7 +425,36 @@ def _to_parquet(df, path, index=None, compression='snappy',
     **kwargs
         Additional keyword arguments passed to pyarrow.parquet.write_table().
     """
-    pass
+    parquet = import_optional_dependency(
+        "pyarrow.parquet", extra="pyarrow is required for Parquet support."
+    )
+    import pyarrow as pa
+
+    path = _expand_user(path)
+    table = _geopandas_to_arrow(
+        df,
+        index=index,
+        geometry_encoding=geometry_encoding,
+        schema_version=schema_version,
+        write_covering_bbox=write_covering_bbox,
+    )
+
+    if "use_dictionary" not in kwargs:
+        # Encoded geometries (and their bounding boxes) are practically
+        # unique per row, so the writer would build a dictionary for those
+        # columns only to abandon it again; only enable dictionary encoding
+        # for the other columns (if those are all flat, as the setting is
+        # per leaf column path)
+        skip = {
+            col for col, dtype in df.dtypes.items() if isinstance(dtype, GeometryDtype)
+        }
+        if write_covering_bbox:
+            skip.add("bbox")
+        other_fields = [field for field in table.schema if field.name not in skip]
+        if not any(pa.types.is_nested(field.type) for field in other_fields):
+            kwargs["use_dictionary"] = [field.name for field in other_fields]
+
+    parquet.write_table(table, path, compression=compression, **kwargs)
 
 
 def _to_feather(df, path, index=None, compression=None, schema_version=None,
@@ -253,14 +490,102 @@ def _to_feather(df, path, index=None, compression=None, schema_version=None,
     kwargs
         Additional keyword arguments passed to pyarrow.feather.write_feather().
     """
-    pass
+    feather = import_optional_dependency(
+        "pyarrow.feather", extra="pyarrow is required for Feather support."
+    )
+    # TODO move this into `import_optional_dependency`
+    import pyarrow
+
+    if Version(pyarrow.__version__) < Version("0.17.0"):
+        raise ImportError("pyarrow >= 0.17 required for Feather support")
+
+    path = _expand_user(path)
+    table = _geopandas_to_arrow(df, index=index, schema_version=schema_version)
+    feather.write_feather(table, path, compression=compression, **kwargs)
 
 
 def _arrow_to_geopandas(table, geo_metadata=None):
     """
     Helper function with main, shared logic for read_parquet/read_feather.
     """
-    pass
+    if geo_metadata is None:
+        geo_metadata = _validate_and_decode_metadata(table.schema.metadata)
+
+    # Find all geometry columns that were read from the file.  May
+    # be a subset if 'columns' parameter is used.
+    geometry_columns = [
+        col for col in geo_metadata["columns"] if col in table.column_names
+    ]
+    result_column_names = list(table.slice(0, 0).to_pandas().columns)
+    geometry_columns.sort(key=result_column_names.index)
+
+    if not geometry_columns:
+        raise ValueError(
+            """No geometry columns are included in the columns read from
+            the Parquet/Feather file.  To read this file without geometry columns,
+            use pandas.read_parquet/read_feather() instead."""
+        )
+
+    geometry = geo_metadata["primary_column"]
+
+    # Missing geometry likely indicates a subset of columns was read;
+    # promote the first available geometry to the primary geometry.
+    if geometry not in geometry_columns:
+        geometry = geometry_columns[0]
+
+        # if there are multiple non-primary geometry columns, raise a warning
+        if len(geometry_columns) > 1:
+            warnings.warn(
+                "Multiple non-primary geometry columns read from Parquet/Feather "
+                "file. The first column read was promoted to the primary geometry.",
+                stacklevel=3,
+            )
+
+    table_attr = table.drop(geometry_columns)
+    df = table_attr.to_pandas()
+
+    # Convert the WKB columns that are present back to geometry.
+    for col in geometry_columns:
+        col_metadata = geo_metadata["columns"][col]
+        if "crs" in col_metadata:
+            crs = col_metadata["crs"]
+            if isinstance(crs, dict):
+                _remove_id_from_member_of_ensembles(crs)
+        else:
+            # per the GeoParquet spec, missing CRS is to be interpreted as
+            # OGC:CRS84
+            crs = "OGC:CRS84"
+
+        if col_metadata["encoding"] == "WKB":
+            geom_arr = from_wkb(np.array(table[col]), crs=crs)
+        else:
+            from geopandas.io._geoarrow import _arrow_to_geometry_array
+
+            geom_arr = _arrow_to_geometry_array(
+                table[col], "geoarrow." + col_metadata["encoding"]
+            )
+            geom_arr.crs = crs
+
+        df.insert(result_column_names.index(col), col, geom_arr)
+
+    return GeoDataFrame(df, geometry=geometry)
+
+
+def _validate_and_decode_metadata(metadata):
+    if metadata is None or b"geo" not in metadata:
+        raise ValueError(
+            """Missing geo metadata in Parquet/Feather file.
+            Use pandas.read_parquet/read_feather() instead."""
+        )
+
+    # check for malformed metadata
+    try:
+        decoded_geo_metadata = _decode_metadata(metadata.get(b"geo", b""))
+    except (TypeError, json.decoder.JSONDecodeError):
+        raise ValueError("Missing or malformed geo metadata in Parquet/Feather file")
+
+    _validate_geo_metadata(decoded_geo_metadata)
+    return decoded_geo_metadata
 
 
 def _get_filesystem_path(path, filesystem=None, storage_options=None):
@@ -269,7 +594,37 @@ def _get_filesystem_path(path, filesystem=None, storage_options=None):
 
     If the filesystem is not None then it's just returned as is.
     """
-    pass
+    import pyarrow
+    from pandas.io.common import is_fsspec_url
+
+    if (
+        isinstance(path, str)
+        and storage_options is None
+        and filesystem is None
+        and Version(pyarrow.__version__) >= Version("5.0.0")
+    ):
+        # Use the native pyarrow filesystem if possible.
+        try:
+            from pyarrow.fs import FileSystem
+
+            filesystem, path = FileSystem.from_uri(path)
+        except Exception:
+            # fallback to use get_handle / fsspec for filesystems
+            # that pyarrow doesn't support
+            pass
+
+    if is_fsspec_url(path) and filesystem is None:
+        fsspec = import_optional_dependency(
+            "fsspec", extra="fsspec is requred for 'storage_options'."
+        )
+        filesystem, path = fsspec.core.url_to_fs(path, **(storage_options or {}))
+
+    if filesystem is None and storage_options:
+        raise ValueError(
+            "Cannot provide 'storage_options' with non-fsspec path '{}'".format(path)
+        )
+
+    return filesystem, path
 
 
 def _ensure_arrow_fs(filesystem):
@@ -278,7 +633,21 @@ def _ensure_arrow_fs(filesystem):
     below because `pyarrow.parquet.read_metadata` does not yet accept a
     filesystem keyword (https://issues.apache.org/jira/browse/ARROW-16719)
     """
-    pass
+    from pyarrow import fs
+
+    if isinstance(filesystem, fs.FileSystem):
+        return filesystem
+
+    # handle fsspec-compatible filesystems
+    try:
+        import fsspec
+    except ImportError:
+        pass
+    else:
+        if isinstance(filesystem, fsspec.AbstractFileSystem):
+            return fs.PyFileSystem(fs.FSSpecHandler(filesystem))
+
+    return filesystem
 
 
 def _read_parquet_schema_and_metadata(path, filesystem):
@@ -290,7 +659,183 @@ def _read_parquet_schema_and_metadata(path, filesystem):
     that the ParquetDataset interface doesn't allow passing the filters on read)
 
     """
-    pass
+    import pyarrow
+    from pyarrow import parquet
+
+    kwargs = {}
+    if Version(pyarrow.__version__) < Version("15.0.0"):
+        kwargs = dict(use_legacy_dataset=False)
+
+    try:
+        schema = parquet.ParquetDataset(path, filesystem=filesystem, **kwargs).schema
+    except Exception:
+        schema = parquet.read_schema(path, filesystem=filesystem)
+
+    metadata = schema.metadata
+
+    # read metadata separately to get the raw Parquet FileMetaData metadata
+    # (pyarrow doesn't properly exposes those in schema.metadata for files
+    # created by GDAL - https://issues.apache.org/jira/browse/ARROW-16688)
+    if metadata is None or b"geo" not in metadata:
+        try:
+            metadata = parquet.read_metadata(path, filesystem=filesystem).metadata
+        except Exception:
+            pass
+
+    return schema, metadata
+
+
+# Cache of the schema and raw metadata of recently read Parquet files, keyed
+# by the identity of the file (including its modification time and size, so
+# a rewritten file is not served stale metadata). The geo metadata is decoded
+# and validated on every read, so validation warnings are always raised.
+_METADATA_CACHE_SIZE = 128
+_metadata_cache = OrderedDict()
+_metadata_cache_lock = threading.Lock()
+
+# files modified less than this long ago are not cached: on filesystems with
+# a coarse modification time resolution, a file rewritten in place within
+# the same time step (with the same size) would otherwise get the same key
+_METADATA_CACHE_MIN_AGE_NS = 2_000_000_000
+
+
+def _clear_metadata_cache():
+    """Clear the cache of Parquet file schemas and metadata."""
+    with _metadata_cache_lock:
+        _metadata_cache.clear()
+
+
+def _metadata_cache_key(path, filesystem):
+    """
+    Get the key identifying a single Parquet file for the metadata cache.
+
+    Returns None if the path can not be cached (a dataset directory, a file
+    on a filesystem that does not report modification times, or a file that
+    was modified too recently).
+    """
+    from pyarrow import fs
+
+    if not isinstance(path, str):
+        return None
+    try:
+        if filesystem is None:
+            if not os.path.isfile(path):
+                return None
+            stat = os.stat(path)
+            key = (
+                "local",
+                os.path.abspath(path),
+                stat.st_dev,
+                stat.st_ino,
+                stat.st_mtime_ns,
+                stat.st_ctime_ns,
+                stat.st_size,
+            )
+            mtime_ns = max(stat.st_mtime_ns, stat.st_ctime_ns)
+        elif isinstance(filesystem, fs.FileSystem):
+            info = filesystem.get_file_info(path)
+            if info.type != fs.FileType.File or info.mtime_ns is None:
+                return None
+            key = (filesystem.type_name, path, info.mtime_ns, info.size)
+            mtime_ns = info.mtime_ns
+        else:
+            return None
+    except (OSError, ValueError):
+        return None
+    if time.time_ns() - mtime_ns < _METADATA_CACHE_MIN_AGE_NS:
+        return None
+    return key
+
+
+def _read_parquet_schema_and_geo_metadata(path, filesystem):
+    """
+    Get the schema and the decoded and validated geo metadata of a Parquet
+    file, reusing the schema and raw metadata of an earlier read of the same
+    unchanged file.
+    """
+    key = _metadata_cache_key(path, filesystem)
+    result = None
+    if key is not None:
+        with _metadata_cache_lock:
+            result = _metadata_cache.get(key)
+            if result is not None:
+                _metadata_cache.move_to_end(key)
+
+    if result is None:
+        result = _read_parquet_schema_and_metadata(path, filesystem)
+        if key is not None:
+            with _metadata_cache_lock:
+                _metadata_cache[key] = result
+                _metadata_cache.move_to_end(key)
+                while len(_metadata_cache) > _METADATA_CACHE_SIZE:
+                    _metadata_cache.popitem(last=False)
+
+    schema, metadata = result
+    return schema, _validate_and_decode_metadata(metadata)
+
+
+def _check_if_covering_in_geo_metadata(geo_metadata):
+    primary_column = geo_metadata["primary_column"]
+    return "covering" in geo_metadata["columns"][primary_column].keys()
+
+
+def _get_bbox_encoding_column_name(geo_metadata):
+    primary_column = geo_metadata["primary_column"]
+    return geo_metadata["columns"][primary_column]["covering"]["bbox"]["xmin"][0]
+
+
+def _get_parquet_bbox_filter(geo_metadata, bbox):
+    primary_column = geo_metadata["primary_column"]
+
+    if _check_if_covering_in_geo_metadata(geo_metadata):
+        bbox_column_name = _get_bbox_encoding_column_name(geo_metadata)
+        return _convert_bbox_to_parquet_filter(bbox, bbox_column_name)
+
+    elif geo_metadata["columns"][primary_column]["encoding"] == "point":
+        import pyarrow.compute as pc
+
+        return (
+            (pc.field((primary_column, "x")) >= bbox[0])
+            & (pc.field((primary_column, "x")) <= bbox[2])
+            & (pc.field((primary_column, "y")) >= bbox[1])
+            & (pc.field((primary_column, "y")) <= bbox[3])
+        )
+
+    else:
+        raise ValueError(
+            "Specifying 'bbox' not supported for this Parquet file (it should either "
+            "have a bbox covering column or use 'point' encoding)."
+        )
+
+
+def _convert_bbox_to_parquet_filter(bbox, bbox_column_name):
+    import pyarrow.compute as pc
+
+    return ~(
+        (pc.field((bbox_column_name, "xmin")) > bbox[2])
+        | (pc.field((bbox_column_name, "ymin")) > bbox[3])
+        | (pc.field((bbox_column_name, "xmax")) < bbox[0])
+        | (pc.field((bbox_column_name, "ymax")) < bbox[1])
+    )
+
+
+def _get_non_bbox_columns(schema, geo_metadata):
+    bbox_column_name = _get_bbox_encoding_column_name(geo_metadata)
+    columns = schema.names
+    if bbox_column_name in columns:
+        columns.remove(bbox_column_name)
+    return columns
+
+
+def _splice_bbox_and_filters(kwarg_filters, bbox_filter):
+    parquet = import_optional_dependency(
+        "pyarrow.parquet", extra="pyarrow is required for Parquet support."
+    )
+    if bbox_filter is None:
+        return kwarg_filters
+
+    filters_expression = parquet.filters_to_expression(kwarg_filters)
+    return bbox_filter & filters_expression
 
 
 def _read_parquet(path, columns=None, storage_options=None, bbox=None, **kwargs
@@ -361,7 +906,45 @@ def _read_parquet(path, columns=None, storage_options=None, bbox=None, **kwargs
     ...     columns=["geometry", "pop_est"]
     ... )  # doctest: +SKIP
     """
-    pass
+    parquet = import_optional_dependency(
+        "pyarrow.parquet", extra="pyarrow is required for Parquet support."
+    )
+    import geopandas.io._pyarrow_hotfix  # noqa: F401
+
+    # TODO(https://github.com/pandas-dev/pandas/pull/41194): see if pandas
+    # adds filesystem as a keyword and match that.
+    filesystem = kwargs.pop("filesystem", None)
+    filesystem, path = _get_filesystem_path(
+        path, filesystem=filesystem, storage_options=storage_options
+    )
+    path = _expand_user(path)
+    schema, geo_metadata = _read_parquet_schema_and_geo_metadata(path, filesystem)
+
+    bbox_filter = (
+        _get_parquet_bbox_filter(geo_metadata, bbox) if bbox is not None else None
+    )
+
+    if_bbox_column_exists = _check_if_covering_in_geo_metadata(geo_metadata)
+
+    # by default, bbox column is not read in, so must specify which
+    # columns are read in if it exists.
+    if not columns and if_bbox_column_exists:
+        columns = _get_non_bbox_columns(schema, geo_metadata)
+
+    # if both bbox and filters kwargs are used, must splice together.
+    if "filters" in kwargs:
+        filters_kwarg = kwargs.pop("filters")
+        filters = _splice_bbox_and_filters(filters_kwarg, bbox_filter)
+    else:
+        filters = bbox_filter
+
+    kwargs["use_pandas_metadata"] = True
+
+    table = parquet.read_table(
+        path, columns=columns, filesystem=filesystem, filters=filters, **kwargs
+    )
+
+    return _arrow_to_geopandas(table, geo_metadata)
 
 
 def _read_feather(path, columns=None, **kwargs):
@@ -415,4 +998,17 @@ def _read_feather(path, columns=None, **kwargs):
     ...     columns=["geometry", "pop_est"]
     ... )  # doctest: +SKIP
     """
-    pass
+    feather = import_optional_dependency(
+        "pyarrow.feather", extra="pyarrow is required for Feather support."
+    )
+    # TODO move this into `import_optional_dependency`
+    import pyarrow
+
+    import geopandas.io._pyarrow_hotfix  # noqa: F401
+
+    if Version(pyarrow.__version__) < Version("0.17.0"):
+        raise ImportError("pyarrow >= 0.17 required for Feather support")
+
+    path = _expand_user(path)
+    table = feather.read_table(path, columns=columns, **kwargs)
+    return _arrow_to_geopandas(table)
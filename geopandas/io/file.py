@@ -2,23 +2,26 @@ from __future__ import annotations
 import os
 import urllib.request
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import IOBase
+from itertools import islice, repeat
 from packaging.version import Version
 from pathlib import Path
 from urllib.parse import urlparse as parse_url
 from urllib.parse import uses_netloc, uses_params, uses_relative
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_integer_dtype
+from pandas.api.types import is_integer_dtype, is_object_dtype
 import shapely
-from shapely.geometry import mapping
+from shapely import GeometryType
+from shapely.geometry import mapping, shape
 from shapely.geometry.base import BaseGeometry
 from geopandas import GeoDataFrame, GeoSeries
 from geopandas._compat import HAS_PYPROJ, PANDAS_GE_20
 from geopandas.io.util import vsi_path
-_VALID_URLS = set(uses_relative + uses_netloc + uses_params)
-_VALID_URLS.discard('')
-_VALID_URLS.discard('file')
+_VALID_URLS = frozenset(uses_relative + uses_netloc + uses_params) - {'', 'file'}
 fiona = None
 fiona_env = None
 fiona_import_error = None
@@ -33,14 +36,30 @@ _EXTENSION_TO_DRIVER = {'.bna': 'BNA', '.dxf': 'DXF', '.csv': 'CSV', '.shp':
     'MapInfo File', '.mif': 'MapInfo File', '.mid': 'MapInfo File', '.dgn':
     'DGN', '.fgb': 'FlatGeobuf'}
 
+# number of records passed to fiona's writerecords per call
+_WRITE_BATCH_SIZE = 10_000
+
+# geometry type names indexed by shapely.get_type_id
+_GEOMETRY_TYPE_NAMES = ('Point', 'LineString', 'LinearRing', 'Polygon',
+    'MultiPoint', 'MultiLineString', 'MultiPolygon', 'GeometryCollection')
+
 
 def _expand_user(path):
     """Expand paths that use ~."""
-    return os.path.expanduser(path)
+    # convert path objects once, and only parse strings that can expand
+    if isinstance(path, os.PathLike):
+        path = os.fspath(path)
+    if isinstance(path, str) and path.startswith("~"):
+        path = os.path.expanduser(path)
+    return path
 
 
 def _is_url(url):
     """Check to see if *url* has a valid protocol."""
+    # a URL needs a "scheme:" prefix, so paths without a colon (and any
+    # non-string input) can be rejected without parsing
+    if not isinstance(url, str) or ":" not in url:
+        return False
     try:
         return parse_url(url).scheme in _VALID_URLS
     except Exception:
@@ -116,14 +135,47 @@ def _read_file(filename, bbox=None, mask=None, columns=None, rows=None,
     if engine is None:
         engine = "pyogrio" if pyogrio is not None else "fiona"
 
+    filename = _expand_user(filename)
+
+    from_bytes = False
+    if _is_url(filename):
+        # if the server supports range requests, pass the URL as is, so the
+        # engine (GDAL's /vsicurl/ handler) only fetches the parts of the file
+        # it needs; otherwise download the data once here. A GET is used for
+        # the probe (not HEAD) so that in the latter case the response that
+        # is already open is read, instead of issuing a second request.
+        with urllib.request.urlopen(filename) as response:
+            if not response.headers.get("Accept-Ranges") == "bytes":
+                filename = response.read()
+                from_bytes = True
+
     if engine == "pyogrio":
         if pyogrio is None:
             raise ImportError("pyogrio is required to use the pyogrio engine")
+        if mask is not None:
+            # pass the mask as a single shapely geometry, which GDAL uses as
+            # spatial filter: candidates are looked up with the spatial index
+            # of the file (if any) using the mask's bounds, and then tested
+            # exactly for intersection, all without Python-level filtering
+            if isinstance(mask, (GeoDataFrame, GeoSeries)):
+                crs = pyogrio.read_info(filename, layer=kwargs.get("layer")).get("crs")
+                if isinstance(filename, IOBase):
+                    filename.seek(0)
+                mask = shapely.unary_union(mask.to_crs(crs).geometry.values)
+            elif isinstance(mask, BaseGeometry):
+                mask = shapely.unary_union(mask)
+            elif isinstance(mask, dict) or hasattr(mask, "__geo_interface__"):
+                # convert GeoJSON to shapely geometry
+                mask = shape(mask)
         return pyogrio.read_dataframe(filename, bbox=bbox, mask=mask, columns=columns, rows=rows, **kwargs)
     elif engine == "fiona":
         if fiona is None:
             raise ImportError("fiona is required to use the fiona engine")
-        with fiona.open(filename, **kwargs) as source:
+        if from_bytes:
+            reader = fiona.BytesCollection
+        else:
+            reader = fiona.open
+        with reader(filename, **kwargs) as source:
             crs = source.crs
             driver = source.driver
             if columns is None:
@@ -133,27 +185,158 @@ def _read_file(filename, bbox=None, mask=None, columns=None, rows=None,
             if mask is not None:
                 source = source.filter(mask=mask)
             if rows is not None:
+                # only read the requested features from the stream (negative
+                # positions can only be resolved on the complete list)
                 if isinstance(rows, int):
-                    source = list(source)[:rows]
-                elif isinstance(rows, slice):
-                    source = list(source)[rows]
+                    rows = slice(rows)
+                if isinstance(rows, slice):
+                    if any(
+                        value is not None and value < 0
+                        for value in (rows.start, rows.stop, rows.step)
+                    ):
+                        source = list(source)[rows]
+                    else:
+                        source = islice(source, rows.start, rows.stop, rows.step)
                 else:
                     raise ValueError("rows must be an integer or a slice object")
-            gdf = GeoDataFrame.from_features(source, crs=crs, columns=columns)
-            gdf.crs = crs
-            return gdf
+            properties = []
+            geometries = []
+            for feature in source:
+                properties.append(dict(feature["properties"] or {}))
+                geometries.append(feature["geometry"])
+            df = pd.DataFrame(properties, columns=columns)
+            df["geometry"] = _geometries_from_mappings(geometries)
+            return GeoDataFrame(df, geometry="geometry", crs=crs)
     else:
         raise ValueError("engine must be either 'pyogrio' or 'fiona'")
 
 
+def _offsets(parts):
+    """Get the offsets into the concatenation of a list of sequences."""
+    return np.concatenate([[0], np.cumsum([len(part) for part in parts])])
+
+
+def _geometries_from_coordinates(geom_type, coordinates):
+    """
+    Create the geometries of a single simple geometry type from their
+    GeoJSON-like coordinates with one vectorized shapely call.
+
+    Returns None for the other geometry types. Raises ValueError if the
+    coordinates can not be combined into a single array (e.g. mixed 2D and
+    3D, or empty geometries).
+    """
+    if geom_type == "Point":
+        coords = np.array(coordinates, dtype="float64")
+        return shapely.points(_check_coordinates(coords))
+    elif geom_type == "LineString":
+        lines = [np.asarray(line, dtype="float64") for line in coordinates]
+        return shapely.from_ragged_array(
+            GeometryType.LINESTRING,
+            _check_coordinates(np.concatenate(lines)),
+            (_offsets(lines),),
+        )
+    elif geom_type == "Polygon":
+        if any(len(polygon) == 0 for polygon in coordinates):
+            # empty polygons have no rings
+            raise ValueError("coordinates can not be combined")
+        rings = [
+            np.asarray(ring, dtype="float64")
+            for polygon in coordinates
+            for ring in polygon
+        ]
+        return shapely.from_ragged_array(
+            GeometryType.POLYGON,
+            _check_coordinates(np.concatenate(rings)),
+            (_offsets(rings), _offsets(coordinates)),
+        )
+    return None
+
+
+def _check_coordinates(coords):
+    """
+    Check that the combined coordinates form a single (N, 2) or (N, 3)
+    array, which is not the case if all geometries of a group are empty.
+    """
+    if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+        raise ValueError("coordinates can not be combined")
+    return coords
+
+
+def _geometries_from_mappings(geometries):
+    """
+    Construct a NumPy array of shapely geometries from GeoJSON-like
+    geometry mappings (e.g. the geometries of fiona features).
+
+    The geometries are grouped by type, and the Point, LineString and
+    Polygon groups are created from their coordinates with a single
+    vectorized call per group, instead of one ``shape()`` call per
+    geometry. Other types, and groups whose coordinates can not be
+    combined (mixed dimensionality, empty geometries), fall back to
+    ``shape()``.
+    """
+    result = np.empty(len(geometries), dtype=object)
+    groups = {}
+    for i, geom in enumerate(geometries):
+        if geom:
+            groups.setdefault(geom["type"], []).append(i)
+
+    for geom_type, idx in groups.items():
+        geoms = None
+        if geom_type in ("Point", "LineString", "Polygon"):
+            try:
+                geoms = _geometries_from_coordinates(
+                    geom_type, [geometries[i]["coordinates"] for i in idx]
+                )
+            except ValueError:
+                pass
+        if geoms is None:
+            geoms = np.empty(len(idx), dtype=object)
+            geoms[:] = [shape(geometries[i]) for i in idx]
+        result[idx] = geoms
+    return result
+
+
+def _read_layers(filename, layers=None, max_workers=None, **kwargs):
+    """
+    Read several layers of a file into a dict of GeoDataFrames keyed by
+    layer name (all layers with geometries if ``layers`` is None).
+
+    With the pyogrio engine, the layers are read concurrently in a thread
+    pool (each read opens its own GDAL dataset and runs without the GIL);
+    fiona is not thread-safe, so there the layers are read one by one.
+
+    Only paths are supported: an open file or buffer can not be shared by
+    several reads, which each consume it from its current position.
+    """
+    if isinstance(filename, (IOBase, bytes)) or hasattr(filename, "read"):
+        raise TypeError(
+            "Reading several layers requires a path, got "
+            f"{type(filename).__name__}"
+        )
+
+    if layers is None:
+        all_layers = _list_layers(filename)
+        layers = all_layers["name"][all_layers["geometry_type"].notna()].tolist()
+
+    engine = kwargs.get("engine") or ("pyogrio" if pyogrio is not None else "fiona")
+    if engine != "pyogrio" or len(layers) < 2:
+        return {layer: _read_file(filename, layer=layer, **kwargs) for layer in layers}
+
+    if max_workers is None:
+        # don't oversubscribe GDAL's block cache with too many readers
+        max_workers = min(8, len(layers))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = executor.map(
+            lambda layer: _read_file(filename, layer=layer, **kwargs), layers
+        )
+        return dict(zip(layers, frames))
+
+
 def _detect_driver(path):
     """
     Attempt to auto-detect driver based on the extension
     """
-    try:
-        return _EXTENSION_TO_DRIVER[os.path.splitext(path)[1].lower()]
-    except KeyError:
-        return None
+    return _EXTENSION_TO_DRIVER.get(os.path.splitext(path)[1].lower())
 
 
 def _to_file(df, filename, driver=None, schema=None, index=None, mode='w',
@@ -232,6 +415,8 @@ def _to_file(df, filename, driver=None, schema=None, index=None, mode='w',
     if engine is None:
         engine = "pyogrio" if pyogrio is not None else "fiona"
 
+    filename = _expand_user(filename)
+
     if driver is None:
         driver = _detect_driver(filename)
 
@@ -243,22 +428,123 @@ def _to_file(df, filename, driver=None, schema=None, index=None, mode='w',
         if fiona is None:
             raise ImportError("fiona is required to use the fiona engine")
         if schema is None:
-            schema = _geometry_types(df)
+            schema = infer_schema(df)
         with fiona.open(filename, mode, driver=driver, crs=crs, schema=schema, **kwargs) as colxn:
-            colxn.writerecords(df.iterfeatures())
+            # hand the records to fiona in fixed-size batches: each call
+            # writes its batch from a list without re-entering the Python
+            # generator, while memory stays bounded for large frames
+            records = _iter_records(df)
+            while True:
+                batch = list(islice(records, _WRITE_BATCH_SIZE))
+                if not batch:
+                    break
+                colxn.writerecords(batch)
             if metadata:
                 colxn.update_metadata(metadata)
     else:
         raise ValueError("engine must be either 'pyogrio' or 'fiona'")
 
 
+_FIONA_TYPES = {
+    "Int32": "int32",
+    "int32": "int32",
+    "Int64": "int",
+    "string": "str",
+    "boolean": "bool",
+}
+
+
+def _convert_type(in_type):
+    """Get the fiona property type for a column dtype."""
+    if is_object_dtype(in_type):
+        return "str"
+    if in_type.name.startswith("datetime64"):
+        # numpy datetime type regardless of frequency
+        return "datetime"
+    if str(in_type) in _FIONA_TYPES:
+        out_type = _FIONA_TYPES[str(in_type)]
+    else:
+        out_type = type(np.zeros(1, in_type).item()).__name__
+    if out_type == "long":
+        out_type = "int"
+    return out_type
+
+
+@lru_cache(maxsize=128)
+def _properties_schema(columns):
+    """
+    Get the fiona properties schema for a tuple of (type, name, dtype)
+    triples.
+
+    Cached, as writing many partitions of the same data (e.g. tiled output)
+    repeats the same columns and dtypes for every file. The type of the
+    column name is part of the key, as labels like 0, 0.0 and False compare
+    (and hash) equal.
+    """
+    return tuple((col, _convert_type(dtype)) for _, col, dtype in columns)
+
+
+def infer_schema(df):
+    """
+    Infer the fiona schema (property types and geometry type) of a
+    GeoDataFrame.
+    """
+    properties = OrderedDict(
+        _properties_schema(
+            tuple(
+                (type(col), col, dtype)
+                for col, dtype in zip(df.columns, df.dtypes)
+                if col != df._geometry_column_name
+            )
+        )
+    )
+
+    if df.empty:
+        warnings.warn(
+            "You are attempting to write an empty DataFrame to file. "
+            "For some drivers, this operation may fail.",
+            UserWarning,
+            stacklevel=3,
+        )
+
+    return {"geometry": _geometry_types(df), "properties": properties}
+
+
+def _iter_records(df):
+    """
+    Generate the GeoJSON-like feature records of a GeoDataFrame for fiona.
+
+    The properties are converted column by column (missing values to None)
+    and zipped into rows, instead of looking up every row through pandas;
+    only the geometry mapping is created per record.
+    """
+    geom_col = df._geometry_column_name
+    names = [col for col in df.columns if col != geom_col]
+    columns = []
+    for col in names:
+        values = df[col].astype(object)
+        columns.append(values.where(values.notna(), None).tolist())
+
+    ids = [str(label) for label in df.index]
+    geoms = np.asarray(df[geom_col].array)
+    for id_, geom, row in zip(ids, geoms, zip(*columns) if names else repeat(())):
+        yield {
+            "id": id_,
+            "type": "Feature",
+            "properties": dict(zip(names, row)),
+            "geometry": mapping(geom) if geom is not None else None,
+        }
+
+
 def _geometry_types(df):
     """
     Determine the geometry types in the GeoDataFrame for the schema.
     """
-    geom_types = set(df.geometry.geom_type)
+    type_ids = np.unique(shapely.get_type_id(np.asarray(df.geometry.array)))
+    # drop missing values (shapely.get_type_id returns -1 for those)
+    geom_types = type_ids[type_ids >= 0]
     if len(geom_types) == 1:
-        return list(geom_types)[0]
+        return _GEOMETRY_TYPE_NAMES[geom_types[0]]
     elif len(geom_types) > 1:
         return "GeometryCollection"
     else:
@@ -287,7 +573,9 @@ def _list_layers(filename) ->pd.DataFrame:
         A DataFrame with columns "name" and "geometry_type" and one row per layer.
     """
     if pyogrio is not None:
-        return pyogrio.list_layers(filename)
+        return pd.DataFrame(
+            pyogrio.list_layers(filename), columns=["name", "geometry_type"]
+        )
     elif fiona is not None:
         with fiona.open(filename) as src:
             layers = [{"name": layer, "geometry_type": src.schema["geometry"]} for layer in src.layers]
@@ -1,4 +1,5 @@
 from __future__ import absolute_import
+import io
 import json
 import os
 import pathlib
@@ -25,30 +26,83 @@ import pyarrow.parquet as pq
 from pyarrow import feather
 
 
-@pytest.mark.parametrize('test_dataset', ['naturalearth_lowres',
-    'naturalearth_cities', 'nybb_filename'])
-def test_roundtrip(tmpdir, file_format, test_dataset, request):
+@pytest.fixture(scope="session")
+def naturalearth_lowres_gdf(naturalearth_lowres):
+    """
+    The naturalearth_lowres dataset as GeoDataFrame, read once per session.
+
+    The same frame is shared between tests, so tests that modify it need to
+    work on a copy.
+    """
+    return read_file(naturalearth_lowres)
+
+
+@pytest.fixture(scope="session")
+def naturalearth_cities_gdf(naturalearth_cities):
+    return read_file(naturalearth_cities)
+
+
+@pytest.fixture(scope="session")
+def nybb_gdf(nybb_filename):
+    return read_file(nybb_filename)
+
+
+@pytest.fixture
+def small_gdf():
+    """
+    A small GeoDataFrame, for tests that only depend on the (geo) metadata and
+    not on the actual data.
+    """
+    return GeoDataFrame(
+        {"a": [1, 2]}, geometry=[Point(0, 0), Point(1, 1)], crs="EPSG:4326"
+    )
+
+
+@pytest.fixture(scope="session", params=["parquet", "feather"])
+def file_format(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def naturalearth_lowres_file(tmp_path_factory, file_format, naturalearth_lowres_gdf):
+    """
+    naturalearth_lowres written once per session in the given file format,
+    for the tests that only read it back.
+    """
+    tmp_file = str(tmp_path_factory.mktemp("arrow") / f"test.{file_format}")
+    if file_format == "parquet":
+        naturalearth_lowres_gdf.to_parquet(tmp_file)
+    elif file_format == "feather":
+        naturalearth_lowres_gdf.to_feather(tmp_file)
+    return tmp_file
+
+
+@pytest.mark.parametrize('test_dataset', ['naturalearth_lowres_gdf',
+    'naturalearth_cities_gdf', 'nybb_gdf'])
+def test_roundtrip(file_format, test_dataset, request):
     """Writing to parquet should not raise errors, and should not alter original
     GeoDataFrame
     """
     gdf = request.getfixturevalue(test_dataset)
-    tmp_file = str(tmpdir.join(f"test.{file_format}"))
+    buf = io.BytesIO()
     
     if file_format == "parquet":
-        gdf.to_parquet(tmp_file)
-        result = read_parquet(tmp_file)
+        gdf.to_parquet(buf)
+        buf.seek(0)
+        result = read_parquet(buf)
     elif file_format == "feather":
-        gdf.to_feather(tmp_file)
-        result = read_feather(tmp_file)
+        gdf.to_feather(buf)
+        buf.seek(0)
+        result = read_feather(buf)
     
     assert_geodataframe_equal(gdf, result)
 
 
-def test_index(tmpdir, file_format, naturalearth_lowres):
+def test_index(tmpdir, file_format, naturalearth_lowres_gdf):
     """Setting index=`True` should preserve index in output, and
     setting index=`False` should drop index from output.
     """
-    gdf = naturalearth_lowres.set_index('name')
+    gdf = naturalearth_lowres_gdf.set_index('name')
     tmp_file = str(tmpdir.join(f"test.{file_format}"))
     
     if file_format == "parquet":
@@ -67,50 +121,54 @@ def test_index(tmpdir, file_format, naturalearth_lowres):
     assert_geodataframe_equal(gdf.reset_index(drop=True), result_without_index)
 
 
-def test_column_order(tmpdir, file_format, naturalearth_lowres):
+def test_column_order(file_format, naturalearth_lowres_gdf):
     """The order of columns should be preserved in the output."""
-    gdf = naturalearth_lowres[['name', 'pop_est', 'continent', 'geometry']]
-    tmp_file = str(tmpdir.join(f"test.{file_format}"))
+    gdf = naturalearth_lowres_gdf[['name', 'pop_est', 'continent', 'geometry']]
+    buf = io.BytesIO()
     
     if file_format == "parquet":
-        gdf.to_parquet(tmp_file)
-        result = read_parquet(tmp_file)
+        gdf.to_parquet(buf)
+        buf.seek(0)
+        result = read_parquet(buf)
     elif file_format == "feather":
-        gdf.to_feather(tmp_file)
-        result = read_feather(tmp_file)
+        gdf.to_feather(buf)
+        buf.seek(0)
+        result = read_feather(buf)
     
     assert list(gdf.columns) == list(result.columns)
 
 
 @pytest.mark.parametrize('compression', ['snappy', 'gzip', 'brotli', None])
-def test_parquet_compression(compression, tmpdir, naturalearth_lowres):
+def test_parquet_compression(compression, naturalearth_lowres_gdf):
     """Using compression options should not raise errors, and should
     return identical GeoDataFrame.
     """
-    tmp_file = str(tmpdir.join("test.parquet"))
-    naturalearth_lowres.to_parquet(tmp_file, compression=compression)
-    result = read_parquet(tmp_file)
-    assert_geodataframe_equal(naturalearth_lowres, result)
+    buf = io.BytesIO()
+    naturalearth_lowres_gdf.to_parquet(buf, compression=compression)
+    buf.seek(0)
+    result = read_parquet(buf)
+    assert_geodataframe_equal(naturalearth_lowres_gdf, result)
 
 
 @pytest.mark.skipif(Version(pyarrow.__version__) < Version('0.17.0'),
     reason='Feather only supported for pyarrow >= 0.17')
 @pytest.mark.parametrize('compression', ['uncompressed', 'lz4', 'zstd'])
-def test_feather_compression(compression, tmpdir, naturalearth_lowres):
+def test_feather_compression(compression, naturalearth_lowres_gdf):
     """Using compression options should not raise errors, and should
     return identical GeoDataFrame.
     """
-    tmp_file = str(tmpdir.join("test.feather"))
-    naturalearth_lowres.to_feather(tmp_file, compression=compression)
-    result = read_feather(tmp_file)
-    assert_geodataframe_equal(naturalearth_lowres, result)
+    buf = io.BytesIO()
+    naturalearth_lowres_gdf.to_feather(buf, compression=compression)
+    buf.seek(0)
+    result = read_feather(buf)
+    assert_geodataframe_equal(naturalearth_lowres_gdf, result)
 
 
-def test_parquet_multiple_geom_cols(tmpdir, file_format, naturalearth_lowres):
+def test_parquet_multiple_geom_cols(tmpdir, file_format, naturalearth_lowres_gdf):
     """If multiple geometry columns are present when written to parquet,
     they should all be returned as such when read from parquet.
     """
-    gdf = naturalearth_lowres.copy()
+    gdf = naturalearth_lowres_gdf.copy()
     gdf['geometry2'] = gdf.geometry.centroid
     tmp_file = str(tmpdir.join(f"test.{file_format}"))
     
@@ -127,15 +185,15 @@ def test_parquet_multiple_geom_cols(tmpdir, file_format, naturalearth_lowres):
     assert_geodataframe_equal(gdf, result)
 
 
-def test_parquet_missing_metadata(tmpdir, naturalearth_lowres):
+def test_parquet_missing_metadata(tmpdir, small_gdf):
     """Missing geo metadata, such as from a parquet file created
     from a pandas DataFrame, will raise a ValueError.
     """
-    df = DataFrame(naturalearth_lowres.drop(columns=['geometry']))
+    df = DataFrame(small_gdf.drop(columns=['geometry']))
     tmp_file = str(tmpdir.join("test.parquet"))
     df.to_parquet(tmp_file)
     
-    with pytest.raises(ValueError, match="Missing geo metadata in Parquet file."):
+    with pytest.raises(ValueError, match="Missing geo metadata in Parquet/Feather file."):
         read_parquet(tmp_file)
 
 
@@ -151,7 +209,7 @@ def test_parquet_missing_metadata2(tmpdir):
     tmp_file = str(tmpdir.join("test.parquet"))
     pq.write_table(table, tmp_file)
     
-    with pytest.raises(ValueError, match="Missing geo metadata in Parquet file."):
+    with pytest.raises(ValueError, match="Missing geo metadata in Parquet/Feather file."):
         read_parquet(tmp_file)
 
 
@@ -161,46 +219,102 @@ def test_parquet_missing_metadata2(tmpdir):
     'Missing or malformed geo metadata in Parquet/Feather file'), ({'geo':
     _encode_metadata({'foo': 'bar'})},
     "'geo' metadata in Parquet/Feather file is missing required key")])
-def test_parquet_invalid_metadata(tmpdir, geo_meta, error, naturalearth_lowres
-    ):
+def test_parquet_invalid_metadata(tmpdir, geo_meta, error, small_gdf):
     """Has geo metadata with missing required fields will raise a ValueError.
 
     This requires writing the parquet file directly below, so that we can
     control the metadata that is written for this test.
     """
-    tmp_file = str(tmpdir.join("test.parquet"))
-    table = pyarrow.Table.from_pandas(naturalearth_lowres)
+    # convert to DataFrame and encode geometry to WKB
+    df = DataFrame(small_gdf)
+    df['geometry'] = to_wkb(df['geometry'].values)
+    
+    table = pyarrow.Table.from_pandas(df)
+    metadata = table.schema.metadata
+    metadata.update(geo_meta)
+    table = table.replace_schema_metadata(metadata)
     
     # Write the parquet file with custom metadata
-    pq.write_table(table, tmp_file, metadata=geo_meta)
+    tmp_file = str(tmpdir.join("test.parquet"))
+    pq.write_table(table, tmp_file)
     
     with pytest.raises(ValueError, match=error):
         read_parquet(tmp_file)
 
 
-def test_subset_columns(tmpdir, file_format, naturalearth_lowres):
+def test_parquet_metadata_validated_on_every_read(tmpdir, small_gdf, monkeypatch):
+    """Cached metadata is still validated (and warns) on every read."""
+    from geopandas.io import arrow
+
+    # allow caching of the freshly written file
+    monkeypatch.setattr(arrow, "_METADATA_CACHE_MIN_AGE_NS", 0)
+    arrow._clear_metadata_cache()
+
+    tmp_file = str(tmpdir.join("test.parquet"))
+    small_gdf.to_parquet(tmp_file)
+    table = pq.read_table(tmp_file)
+    geo = _decode_metadata(table.schema.metadata[b'geo'])
+    geo['columns']['geometry']['edges'] = 'spherical'
+    metadata = table.schema.metadata
+    metadata[b'geo'] = _encode_metadata(geo)
+    pq.write_table(table.replace_schema_metadata(metadata), tmp_file)
+
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="has spherical edges"):
+            result = read_parquet(tmp_file)
+        assert_geodataframe_equal(result, small_gdf)
+    assert len(arrow._metadata_cache) == 1
+    arrow._clear_metadata_cache()
+
+
+def test_metadata_bbox_without_geometries():
+    """The bbox of only missing or empty geometries is encoded as null."""
+    df = GeoDataFrame(geometry=[None, Polygon()])
+    metadata = _create_metadata(df, write_covering_bbox=True)
+    encoded = _encode_metadata(metadata)
+    assert b'NaN' not in encoded
+    assert _decode_metadata(encoded)['columns']['geometry']['bbox'] == [None] * 4
+
+
+def test_decode_metadata_nan():
+    """Metadata written with NaN by the stdlib json module can be read."""
+    encoded = json.dumps({'bbox': [float('nan')] * 4}).encode('utf-8')
+    assert np.isnan(_decode_metadata(encoded)['bbox']).all()
+
+
+def test_bbox_filter_keeps_nan_bbox():
+    """Rows with a NaN bbox (e.g. empty geometries) are not filtered out."""
+    import pyarrow.dataset as ds
+
+    nan = float('nan')
+    table = pyarrow.table({'bbox': [
+        {'xmin': 0.0, 'ymin': 0.0, 'xmax': 1.0, 'ymax': 1.0},
+        {'xmin': nan, 'ymin': nan, 'xmax': nan, 'ymax': nan},
+        {'xmin': 5.0, 'ymin': 5.0, 'xmax': 6.0, 'ymax': 6.0},
+    ], 'id': [0, 1, 2]})
+    bbox_filter = _convert_bbox_to_parquet_filter((0, 0, 2, 2), 'bbox')
+    result = ds.dataset(table).to_table(filter=bbox_filter)
+    assert result['id'].to_pylist() == [0, 1]
+
+
+def test_subset_columns(naturalearth_lowres_file, file_format, naturalearth_lowres_gdf):
     """Reading a subset of columns should correctly decode selected geometry
     columns.
     """
-    gdf = naturalearth_lowres
-    tmp_file = str(tmpdir.join(f"test.{file_format}"))
-    
     if file_format == "parquet":
-        gdf.to_parquet(tmp_file)
-        result = read_parquet(tmp_file, columns=['name', 'geometry'])
+        result = read_parquet(naturalearth_lowres_file, columns=['name', 'geometry'])
     elif file_format == "feather":
-        gdf.to_feather(tmp_file)
-        result = read_feather(tmp_file, columns=['name', 'geometry'])
+        result = read_feather(naturalearth_lowres_file, columns=['name', 'geometry'])
     
-    expected = gdf[['name', 'geometry']]
+    expected = naturalearth_lowres_gdf[['name', 'geometry']]
     assert_geodataframe_equal(expected, result)
 
 
-def test_promote_secondary_geometry(tmpdir, file_format, naturalearth_lowres):
+def test_promote_secondary_geometry(tmpdir, file_format, naturalearth_lowres_gdf):
     """Reading a subset of columns that does not include the primary geometry
     column should promote the first geometry column present.
     """
-    gdf = naturalearth_lowres.copy()
+    gdf = naturalearth_lowres_gdf.copy()
     gdf['geometry2'] = gdf.geometry.centroid
     tmp_file = str(tmpdir.join(f"test.{file_format}"))
     
@@ -216,27 +330,22 @@ def test_promote_secondary_geometry(tmpdir, file_format, naturalearth_lowres):
     assert_geoseries_equal(gdf['geometry2'], result.geometry)
 
 
-def test_columns_no_geometry(tmpdir, file_format, naturalearth_lowres):
+def test_columns_no_geometry(naturalearth_lowres_file, file_format):
     """Reading a parquet file that is missing all of the geometry columns
     should raise a ValueError"""
-    gdf = naturalearth_lowres
-    tmp_file = str(tmpdir.join(f"test.{file_format}"))
-    
     if file_format == "parquet":
-        gdf.to_parquet(tmp_file)
-        with pytest.raises(ValueError, match="No geometry columns found"):
-            read_parquet(tmp_file, columns=['name', 'pop_est'])
+        with pytest.raises(ValueError, match="No geometry columns are included in the columns read"):
+            read_parquet(naturalearth_lowres_file, columns=['name', 'pop_est'])
     elif file_format == "feather":
-        gdf.to_feather(tmp_file)
-        with pytest.raises(ValueError, match="No geometry columns found"):
-            read_feather(tmp_file, columns=['name', 'pop_est'])
+        with pytest.raises(ValueError, match="No geometry columns are included in the columns read"):
+            read_feather(naturalearth_lowres_file, columns=['name', 'pop_est'])
 
 
-def test_missing_crs(tmpdir, file_format, naturalearth_lowres):
+def test_missing_crs(tmpdir, file_format, naturalearth_lowres_gdf):
     """If CRS is `None`, it should be properly handled
     and remain `None` when read from parquet`.
     """
-    gdf = naturalearth_lowres.copy()
+    gdf = naturalearth_lowres_gdf.copy()
     gdf.crs = None
     tmp_file = str(tmpdir.join(f"test.{file_format}"))
     
@@ -11,7 +11,18 @@ import numpy as np
 import pandas as pd
 import pytz
 from pandas.api.types import is_datetime64_any_dtype
-from shapely.geometry import Point, Polygon, box, mapping
+import shapely
+from shapely.geometry import (
+    GeometryCollection,
+    LineString,
+    MultiLineString,
+    MultiPoint,
+    MultiPolygon,
+    Point,
+    Polygon,
+    box,
+    mapping,
+)
 import geopandas
 from geopandas import GeoDataFrame, read_file
 from geopandas._compat import HAS_PYPROJ, PANDAS_GE_20, PANDAS_GE_30
@@ -154,3 +165,141 @@ class FileNumber(object):
     def __next__(self):
         self.fileno += 1
         return repr(self)
+
+
+def test_iter_records():
+    from geopandas.io.file import _iter_records
+
+    df = GeoDataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": [0.5, np.nan, 1.5],
+            "c": ["x", None, "z"],
+            "geometry": [Point(0, 0), None, box(0, 0, 1, 1)],
+        },
+        index=["r1", "r2", "r3"],
+    )
+    records = list(_iter_records(df))
+    assert records == [
+        {
+            "id": "r1",
+            "type": "Feature",
+            "properties": {"a": 1, "b": 0.5, "c": "x"},
+            "geometry": mapping(Point(0, 0)),
+        },
+        {
+            "id": "r2",
+            "type": "Feature",
+            "properties": {"a": 2, "b": None, "c": None},
+            "geometry": None,
+        },
+        {
+            "id": "r3",
+            "type": "Feature",
+            "properties": {"a": 3, "b": 1.5, "c": "z"},
+            "geometry": mapping(box(0, 0, 1, 1)),
+        },
+    ]
+    # the values are Python scalars, not NumPy scalars
+    assert type(records[0]["properties"]["a"]) is int
+
+
+def test_iter_records_geometry_only():
+    from geopandas.io.file import _iter_records
+
+    df = GeoDataFrame(geometry=[Point(0, 0), Point(1, 1)])
+    records = list(_iter_records(df))
+    assert [record["properties"] for record in records] == [{}, {}]
+    assert [record["id"] for record in records] == ["0", "1"]
+
+
+@pytest.mark.parametrize("engine", ["pyogrio", "fiona"])
+def test_read_layers(monkeypatch, engine):
+    import geopandas.io.file as file_module
+
+    layers = pd.DataFrame(
+        {"name": ["points", "table", "polygons"],
+         "geometry_type": ["Point", None, "Polygon"]}
+    )
+    monkeypatch.setattr(file_module, "_list_layers", lambda filename: layers)
+
+    def read(filename, layer=None, **kwargs):
+        assert filename == "layers.gpkg"
+        assert kwargs == {"engine": engine}
+        return GeoDataFrame({"layer": [layer]}, geometry=[Point(0, 0)])
+
+    monkeypatch.setattr(file_module, "_read_file", read)
+
+    # the non-spatial layer is skipped
+    result = file_module._read_layers("layers.gpkg", engine=engine)
+    assert list(result) == ["points", "polygons"]
+    for layer, frame in result.items():
+        assert frame["layer"].tolist() == [layer]
+
+    result = file_module._read_layers(
+        "layers.gpkg", layers=["polygons"], engine=engine
+    )
+    assert list(result) == ["polygons"]
+
+
+@pytest.mark.parametrize("make_input", [io.BytesIO, bytes])
+def test_read_layers_file_like(make_input):
+    from geopandas.io.file import _read_layers
+
+    with pytest.raises(TypeError, match="requires a path"):
+        _read_layers(make_input(b"data"), layers=["a", "b"])
+
+
+@pytest.mark.parametrize(
+    "geometries",
+    [
+        # 2D and 3D geometries of the same type
+        [Point(0, 1), Point(1, 2, 3), Point(2, 3)],
+        [LineString([(0, 0), (1, 1)]), LineString([(0, 0, 1), (1, 1, 2)])],
+        [Point(0, 1, 2), Point(1, 2, 3)],
+        # empty geometries
+        [Point(0, 1), Point()],
+        [Point(), Point()],
+        [LineString(), LineString([(0, 0), (1, 1)])],
+        [LineString(), LineString()],
+        [Polygon(), box(0, 0, 1, 1)],
+        [Polygon(), Polygon()],
+        # polygons with holes
+        [
+            Polygon(
+                [(0, 0), (10, 0), (10, 10), (0, 10)],
+                [[(1, 1), (2, 1), (2, 2)], [(5, 5), (6, 5), (6, 6)]],
+            ),
+            box(0, 0, 1, 1),
+        ],
+        # missing geometries
+        [None, Point(0, 1), None, box(0, 0, 1, 1)],
+        [None, None],
+        # Multi* types and collections
+        [
+            MultiPoint([(0, 0), (1, 1)]),
+            MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3)]]),
+            MultiPolygon([box(0, 0, 1, 1), box(2, 2, 3, 3)]),
+            GeometryCollection([Point(0, 0), LineString([(0, 0), (1, 1)])]),
+            Point(0, 0),
+        ],
+    ],
+)
+def test_geometries_from_mappings(geometries):
+    # the geometry mappings as read from fiona features
+    from geopandas.io.file import _geometries_from_mappings
+
+    features = [
+        {
+            "type": "Feature",
+            "properties": {"a": i},
+            "geometry": mapping(geom) if geom is not None else None,
+        }
+        for i, geom in enumerate(geometries)
+    ]
+    result = _geometries_from_mappings([f["geometry"] for f in features])
+    expected = GeoDataFrame.from_features(features).geometry.values
+    assert result.dtype == object
+    assert len(result) == len(geometries)
+    assert list(shapely.to_wkt(result)) == list(shapely.to_wkt(np.asarray(expected)))
+    assert list(shapely.has_z(result)) == list(shapely.has_z(np.asarray(expected)))
@@ -14,3 +14,125 @@ import pyarrow as pa
 import pyarrow.compute as pc
 from pyarrow import feather
 DATA_PATH = pathlib.Path(os.path.dirname(__file__)) / 'data'
+
+
+@pytest.mark.parametrize(
+    "geom_type,coords,expected",
+    [
+        (
+            "Polygon",
+            [[[0, 0], [4, 0], [4, 4], [0, 0]], [[1, 1], [2, 1], [2, 2], [1, 1]]],
+            shapely.Polygon(
+                [(0, 0), (4, 0), (4, 4), (0, 0)], [[(1, 1), (2, 1), (2, 2), (1, 1)]]
+            ),
+        ),
+        (
+            "MultiLineString",
+            [[[0, 0], [1, 1]], [[2, 2], [3, 3]]],
+            shapely.MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3)]]),
+        ),
+    ],
+)
+def test_struct_encoding_nested_types(geom_type, coords, expected):
+    # the struct (type, coordinates) encoding with two levels of nesting
+    from geopandas.io._geoarrow import _arrow_to_geometry_array
+
+    point_type = pa.list_(pa.float64(), 2)
+    arr = pa.StructArray.from_arrays(
+        [
+            pa.array([geom_type, None, geom_type]),
+            pa.array([coords, None, coords], pa.list_(pa.list_(point_type))),
+        ],
+        names=["type", "coordinates"],
+    )
+    result = _arrow_to_geometry_array(arr, None)
+    assert result[0].equals(expected)
+    assert result[1] is None
+    assert result[2].equals(expected)
+
+
+def test_struct_encoding_multipolygon():
+    from geopandas.io._geoarrow import _arrow_to_geometry_array
+
+    point_type = pa.list_(pa.float64(), 2)
+    coords = [[[[0, 0], [1, 0], [1, 1], [0, 0]]], [[[2, 2], [3, 2], [3, 3], [2, 2]]]]
+    arr = pa.StructArray.from_arrays(
+        [
+            pa.array(["MultiPolygon"]),
+            pa.array([coords], pa.list_(pa.list_(pa.list_(point_type)))),
+        ],
+        names=["type", "coordinates"],
+    )
+    result = _arrow_to_geometry_array(arr, None)
+    expected = shapely.MultiPolygon(
+        [
+            shapely.Polygon([(0, 0), (1, 0), (1, 1), (0, 0)]),
+            shapely.Polygon([(2, 2), (3, 2), (3, 3), (2, 2)]),
+        ]
+    )
+    assert result[0].equals(expected)
+
+
+@pytest.mark.skipif(
+    Version(pa.__version__) < Version("14.0.0"), reason="requires pyarrow >= 14"
+)
+def test_arrow_to_geometry_array_field_metadata():
+    # GeoArrow extension name in the field metadata only (no registered
+    # extension type), as returned by the GeoArrowArray wrapper
+    from geopandas.io._geoarrow import (
+        GeoArrowArray,
+        arrow_to_geometry_array,
+        construct_geometry_array,
+    )
+
+    geoms = np.array(
+        [shapely.Polygon([(0, 0), (1, 0), (1, 1)]), None, box(2, 2, 3, 3)]
+    )
+    field, arr = construct_geometry_array(geoms)
+    result = arrow_to_geometry_array(GeoArrowArray(field, arr))
+    assert_geoseries_equal(GeoSeries(result), GeoSeries(geoms))
+
+
+@pytest.mark.skipif(
+    Version(pa.__version__) < Version("14.0.0"), reason="requires pyarrow >= 14"
+)
+def test_arrow_to_geometry_array_wkb():
+    from geopandas.io._geoarrow import arrow_to_geometry_array
+
+    geoms = np.array([Point(0, 1), None, box(2, 2, 3, 3)])
+    arr = pa.array(shapely.to_wkb(geoms))
+    result = arrow_to_geometry_array(arr)
+    assert_geoseries_equal(GeoSeries(result), GeoSeries(geoms))
+
+    result = arrow_to_geometry_array(pa.chunked_array([arr, arr]))
+    assert_geoseries_equal(
+        GeoSeries(result), GeoSeries(np.concatenate([geoms, geoms]))
+    )
+
+
+@pytest.mark.skipif(
+    Version(shapely.__version__) < Version("2.0.4"),
+    reason="ISO WKB requires shapely >= 2.0.4",
+)
+def test_wkb_to_arrow_iso_flavor():
+    from geopandas.io._geoarrow import wkb_to_arrow
+
+    result = wkb_to_arrow(np.array([Point(0, 1, 2)]))
+    # ISO WKB geometry type code of a 3D point (little endian)
+    assert result[0].as_py()[1:5] == (1001).to_bytes(4, "little")
+
+
+def test_geopandas_to_arrow_pandas_metadata():
+    from geopandas.io._geoarrow import geopandas_to_arrow
+
+    df = GeoDataFrame(
+        {"a": [1, 2], "geometry": [Point(0, 1), None], "b": ["x", "y"]}
+    )
+    table = geopandas_to_arrow(df)
+    assert table.column_names == ["a", "geometry", "b"]
+    assert table.schema.field("geometry").type == pa.binary()
+
+    pandas_metadata = json.loads(table.schema.metadata[b"pandas"])
+    names = [col["name"] for col in pandas_metadata["columns"]]
+    assert names == ["a", "geometry", "b"]
+    assert table.to_pandas().columns.tolist() == ["a", "geometry", "b"]
@@ -29,3 +29,75 @@ linestring_3D = LineString(((-73.5541107525234, 45.5091983609661, 300), (-
 polygon_3D = Polygon(((-73.5541107525234, 45.5091983609661, 300), (-
     73.5535801792994, 45.5089539203786, 300), (-73.5541107525234, 
     45.5091983609661, 300)))
+
+
+def test_infer_schema_only_points():
+    df = GeoDataFrame(geometry=[city_hall_entrance, city_hall_balcony])
+    assert infer_schema(df) == {'geometry': 'Point', 'properties': OrderedDict()}
+
+
+def test_infer_schema_points_and_multipoints():
+    df = GeoDataFrame(geometry=[MultiPoint([city_hall_entrance,
+        city_hall_balcony]), city_hall_balcony])
+    assert infer_schema(df) == {'geometry': 'GeometryCollection',
+        'properties': OrderedDict()}
+
+
+def test_infer_schema_mixed_types():
+    df = GeoDataFrame(geometry=[city_hall_entrance, city_hall_boundaries,
+        MultiLineString(city_hall_walls)])
+    assert infer_schema(df) == {'geometry': 'GeometryCollection',
+        'properties': OrderedDict()}
+
+
+def test_infer_schema_null_geometry_and_point():
+    # missing geometries do not count as a separate geometry type
+    df = GeoDataFrame(geometry=[None, city_hall_entrance])
+    assert infer_schema(df) == {'geometry': 'Point', 'properties': OrderedDict()}
+
+
+def test_infer_schema_null_geometry_all():
+    df = GeoDataFrame(geometry=[None, None])
+    assert infer_schema(df) == {'geometry': None, 'properties': OrderedDict()}
+
+
+def test_infer_schema_properties():
+    df = GeoDataFrame({
+        'int': np.array([1, 2], dtype='int64'),
+        'int32': np.array([1, 2], dtype='int32'),
+        'nullable_int': pd.array([1, None], dtype='Int64'),
+        'float': [0.5, 1.5],
+        'str': ['a', 'b'],
+        'bool': [True, False],
+        'datetime': pd.to_datetime(['2020-01-01', '2020-01-02']),
+        'geometry': [city_hall_entrance, city_hall_balcony],
+    })
+    assert infer_schema(df) == {
+        'geometry': 'Point',
+        'properties': OrderedDict([
+            ('int', 'int'),
+            ('int32', 'int32'),
+            ('nullable_int', 'int'),
+            ('float', 'float'),
+            ('str', 'str'),
+            ('bool', 'bool'),
+            ('datetime', 'datetime'),
+        ]),
+    }
+
+
+@pytest.mark.parametrize('label', [0, 0.0, False])
+def test_infer_schema_equal_column_labels(label):
+    # labels that compare equal must not share a cached properties schema
+    df = GeoDataFrame({label: ['a', 'b'], 'geometry': [city_hall_entrance,
+        city_hall_balcony]})
+    properties = infer_schema(df)['properties']
+    assert list(properties) == [label]
+    assert type(next(iter(properties))) is type(label)
+
+
+def test_infer_schema_empty_warns():
+    df = GeoDataFrame({'a': pd.Series([], dtype='int64')}, geometry=[])
+    with pytest.warns(UserWarning, match='empty DataFrame'):
+        schema = infer_schema(df)
+    assert schema == {'geometry': None, 'properties': OrderedDict([('a', 'int')])}
@@ -7,7 +7,17 @@ see geopandas.tests.util for more information.
 import os
 import warnings
 from importlib.util import find_spec
+import numpy as np
 import pandas as pd
+from shapely.geometry import (
+    GeometryCollection,
+    LinearRing,
+    LineString,
+    MultiPoint,
+    MultiPolygon,
+    Point,
+    Polygon,
+)
 import geopandas
 import geopandas._compat as compat
 from geopandas import GeoDataFrame, read_file, read_postgis
@@ -303,3 +313,112 @@ class TestIO:
     def test_read_non_epsg_crs_chunksize(self, connection_postgis, df_nybb):
         """Test chunksize argument with non epsg crs"""
         pass
+
+
+def _ewkb_frame(srid):
+    import shapely
+
+    geom = shapely.set_srid(shapely.Point(0, 0), srid)
+    return pd.DataFrame(
+        {"geom": [shapely.to_wkb(geom, hex=True, include_srid=True)]}
+    )
+
+
+def test_df_to_geodf_spatial_ref_sys_lookup():
+    import sqlite3
+
+    from geopandas.io.sql import _df_to_geodf
+
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE spatial_ref_sys (srid INTEGER, auth_name TEXT)")
+    con.execute("INSERT INTO spatial_ref_sys VALUES (102003, 'ESRI')")
+    con.execute("INSERT INTO spatial_ref_sys VALUES (4326, 'EPSG')")
+
+    df = _df_to_geodf(_ewkb_frame(102003), geom_col="geom", con=con)
+    assert df.crs == "ESRI:102003"
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        df = _df_to_geodf(_ewkb_frame(4326), geom_col="geom", con=con)
+    assert df.crs == "EPSG:4326"
+
+    # the table is queried again for every read, not cached per connection
+    con.execute("DELETE FROM spatial_ref_sys WHERE srid = 4326")
+    with pytest.warns(UserWarning, match="Could not find srid 4326"):
+        df = _df_to_geodf(_ewkb_frame(4326), geom_col="geom", con=con)
+    assert df.crs == "EPSG:4326"
+
+
+@pytest.mark.parametrize(
+    "geoms,expected",
+    [
+        ([Point(0, 0), Point(1, 1)], "POINT"),
+        ([LineString([(0, 0), (1, 1)])], "LINESTRING"),
+        ([LinearRing([(0, 0), (1, 1), (1, 0)])], "LINESTRING"),
+        ([Polygon([(0, 0), (1, 1), (1, 0)])], "POLYGON"),
+        ([MultiPoint([(0, 0), (1, 1)])], "MULTIPOINT"),
+        ([MultiPolygon([Polygon([(0, 0), (1, 1), (1, 0)])])], "MULTIPOLYGON"),
+        ([GeometryCollection([Point(0, 0)])], "GEOMETRYCOLLECTION"),
+        (
+            [
+                Polygon([(0, 0), (1, 1), (1, 0)]),
+                MultiPolygon([Polygon([(0, 0), (1, 1), (1, 0)])]),
+            ],
+            "GEOMETRY",
+        ),
+        ([Point(0, 0), LineString([(0, 0), (1, 1)])], "GEOMETRY"),
+        ([Point(0, 0), None], "POINT"),
+        ([Point(0, 0, 0), Point(1, 1)], "POINTZ"),
+        ([Point(0, 0, 0), LineString([(0, 0), (1, 1)])], "GEOMETRYZ"),
+    ],
+)
+def test_get_geometry_type(geoms, expected):
+    from geopandas.io.sql import _get_geometry_type
+
+    assert _get_geometry_type(GeoDataFrame(geometry=geoms)) == expected
+
+
+def test_write_postgis_column_types():
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    pytest.importorskip("geoalchemy2")
+
+    df = GeoDataFrame(
+        {
+            "i": np.array([1, 2], dtype="int64"),
+            "f": [0.5, 1.5],
+            "s": ["a", "b"],
+            "b": [True, False],
+            "t": pd.to_datetime(["2021-01-01", "2021-01-02"]),
+            "geometry": [Point(0, 0), Point(1, 1)],
+        }
+    )
+    engine = sqlalchemy.create_engine("sqlite://")
+    with mock.patch.object(pd.DataFrame, "to_sql") as to_sql:
+        write_postgis(df, "test", engine, dtype={"f": sqlalchemy.types.Numeric})
+
+    dtype = to_sql.call_args.kwargs["dtype"]
+    assert dtype["i"] is sqlalchemy.types.BIGINT
+    assert dtype["s"] is sqlalchemy.types.VARCHAR
+    assert dtype["b"] is sqlalchemy.types.BOOLEAN
+    assert dtype["t"] is sqlalchemy.types.DATETIME
+    # types given by the user take precedence
+    assert dtype["f"] is sqlalchemy.types.Numeric
+    assert dtype["geometry"].geometry_type == "POINT"
+    assert dtype["geometry"].srid == 0
+
+
+def test_df_to_geodf_memoryview_and_missing():
+    import shapely
+
+    from geopandas.io.sql import _df_to_geodf
+
+    wkb = shapely.to_wkb(Point(1, 2))
+    df = pd.DataFrame({"geom": [memoryview(wkb), np.nan, None]})
+    result = _df_to_geodf(df, geom_col="geom")
+    assert result.geometry.iloc[0] == Point(1, 2)
+    assert result.geometry.iloc[1:].isna().all()
+    assert result.crs is None
+
+    df = pd.DataFrame({"geom": [np.nan, None]})
+    result = _df_to_geodf(df, geom_col="geom")
+    assert result.geometry.isna().all()
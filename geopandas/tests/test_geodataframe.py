@@ -179,6 +179,17 @@ class TestDataFrame:
             df["other_geom"] = vals
             assert isinstance(df["other_geom"].values, GeometryArray)
 
+    @pytest.mark.skipif(not compat.HAS_PYPROJ, reason="Requires pyproj")
+    def test_geo_setitem_scalar_geometry(self):
+        df = GeoDataFrame(
+            {"A": range(3), "geometry": [Point(x, x) for x in range(3)]},
+            crs="EPSG:4326",
+        )
+        df["geometry"] = Point(0, 0)
+        expected = GeoSeries([Point(0, 0)] * 3, crs="EPSG:4326", name="geometry")
+        assert_geoseries_equal(df["geometry"], expected)
+        assert df.crs == "EPSG:4326"
+
     def test_geometry_property(self):
         assert_geoseries_equal(
             self.df.geometry,
@@ -804,6 +804,21 @@ def test_non_overlapping(how):
     assert_geodataframe_equal(result, expected)
 
 
+@pytest.mark.parametrize("keep_geom_type", [True, False])
+def test_non_overlapping_bounds_intersection(keep_geom_type):
+    # disjoint total bounds, for which the intersection is short-circuited
+    s1 = GeoSeries([box(0, 0, 1, 1), box(1, 1, 2, 2)])
+    s2 = GeoSeries([box(5, 5, 6, 6), box(6, 6, 7, 7)])
+    df1 = GeoDataFrame({"col1": [1, 2], "geometry": s1})
+    df2 = GeoDataFrame({"col2": [1, 2], "geometry": s2})
+
+    result = overlay(df1, df2, how="intersection", keep_geom_type=keep_geom_type)
+
+    assert isinstance(result, GeoDataFrame)
+    assert result.empty
+    assert set(result.columns) == {"col1", "col2", "geometry"}
+
+
 def test_no_intersection():
     # overlapping bounds but non-overlapping geometries
     gs = GeoSeries([Point(x, x).buffer(0.1) for x in range(3)])
@@ -265,6 +265,8 @@ def test_astype(s, df):
     # check whether returned object is a geodataframe
     res = df.astype({"value1": float})
     assert isinstance(res, GeoDataFrame)
+    assert res.geometry.name == "geom_list"
+    assert res["value1"].dtype == float
 
     # check whether returned object is a dataframe
     res = df.astype(str)
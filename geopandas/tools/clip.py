@@ -10,7 +10,13 @@ import numpy as np
 import pandas.api.types
 from shapely.geometry import MultiPolygon, Polygon, box
 from geopandas import GeoDataFrame, GeoSeries
-from geopandas.array import _check_crs, _crs_mismatch_warn
+from geopandas.array import _crs_mismatch_warn
+
+
+def _mask_is_list_like_rectangle(mask):
+    return pandas.api.types.is_list_like(mask) and not isinstance(
+        mask, (GeoDataFrame, GeoSeries, Polygon, MultiPolygon)
+    )
 
 
 def _clip_gdf_with_mask(gdf, mask, sort=False):
@@ -116,11 +122,40 @@ def clip(gdf, mask, keep_geom_type=False, sort=False):
     >>> nws_groceries.shape
     (7, 8)
     """
+    mask_is_list_like = _mask_is_list_like_rectangle(mask)
+    if (
+        not isinstance(mask, (GeoDataFrame, GeoSeries, Polygon, MultiPolygon))
+        and not mask_is_list_like
+    ):
+        raise TypeError(
+            "'mask' should be GeoDataFrame, GeoSeries,"
+            f"(Multi)Polygon or list-like, got {type(mask)}"
+        )
+
+    if mask_is_list_like and len(mask) != 4:
+        raise TypeError(
+            "If 'mask' is list-like, it must have four values (minx, miny, maxx, maxy)"
+        )
+
+    if isinstance(mask, (GeoDataFrame, GeoSeries)):
+        if gdf.crs != mask.crs:
+            _crs_mismatch_warn(gdf.crs, mask.crs, stacklevel=3)
+
+    if isinstance(mask, (GeoDataFrame, GeoSeries)):
+        box_mask = mask.total_bounds
+    elif mask_is_list_like:
+        box_mask = mask
+    else:
+        box_mask = mask.bounds
+    box_gdf = gdf.total_bounds
+    if not (box_mask[0] <= box_gdf[2] and box_gdf[0] <= box_mask[2] and
+            box_mask[1] <= box_gdf[3] and box_gdf[1] <= box_mask[3]):
+        # the bounding boxes do not overlap, nothing to clip
+        return gdf.iloc[:0]
+
     if isinstance(gdf, GeoSeries):
         return _clip_gdf_with_mask(GeoDataFrame(geometry=gdf), mask, sort=sort).geometry
 
-    _check_crs(gdf, mask)
-
     if isinstance(mask, (GeoDataFrame, GeoSeries)):
         mask = mask.geometry.unary_union
     elif isinstance(mask, (list, tuple)) and len(mask) == 4:
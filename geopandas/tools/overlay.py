@@ -174,6 +174,16 @@ def overlay(df1, df2, how='intersection', keep_geom_type=None, make_valid=True):
     Every operation in GeoPandas is planar, i.e. the potential third
     dimension is not taken into account.
     """
+    if how == 'intersection':
+        box1 = df1.total_bounds
+        box2 = df2.total_bounds
+        if not (box1[0] <= box2[2] and box2[0] <= box1[2] and
+                box1[1] <= box2[3] and box2[1] <= box1[3]):
+            # the bounding boxes do not overlap, so the result is empty:
+            # only run the overlay on empty frames to get the result columns
+            df1 = df1.iloc[:0].copy()
+            df2 = df2.iloc[:0].copy()
+
     if make_valid:
         df1.geometry = df1.geometry.make_valid()
         df2.geometry = df2.geometry.make_valid()
@@ -202,7 +212,8 @@ def overlay(df1, df2, how='intersection', keep_geom_type=None, make_valid=True):
         keep_geom_type = True
         warnings.warn("Default behavior of keep_geom_type will change to False in a future version.", FutureWarning)
 
-    if keep_geom_type:
+    # (an empty df1, e.g. for disjoint inputs, has no geometry type to keep)
+    if keep_geom_type and len(df1):
         result = result[result.geometry.geom_type == df1.geometry.geom_type[0]]
 
     return result
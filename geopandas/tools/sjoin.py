@@ -3,6 +3,7 @@ from functools import partial
 from typing import Optional
 import numpy as np
 import pandas as pd
+import shapely
 from geopandas import GeoDataFrame
 from geopandas._compat import PANDAS_GE_30
 from geopandas.array import _check_crs, _crs_mismatch_warn
@@ -94,7 +95,22 @@ def sjoin(left_df, right_df, how='inner', predicate='intersects', lsuffix=
     Every operation in GeoPandas is planar, i.e. the potential third
     dimension is not taken into account.
     """
-    pass
+    if kwargs:
+        first = next(iter(kwargs.keys()))
+        raise TypeError(f"sjoin() got an unexpected keyword argument '{first}'")
+
+    if isinstance(on_attribute, str):
+        on_attribute = [on_attribute]
+
+    _basic_checks(left_df, right_df, how, lsuffix, rsuffix, on_attribute)
+
+    if left_df.crs != right_df.crs:
+        _crs_mismatch_warn(left_df.crs, right_df.crs, stacklevel=3)
+
+    indices = _geom_predicate_query(left_df, right_df, predicate, distance,
+        on_attribute=on_attribute)
+    return _frame_join(left_df, right_df, indices, None, how, lsuffix,
+        rsuffix, predicate, on_attribute=on_attribute)
 
 
 def _basic_checks(left_df, right_df, how, lsuffix, rsuffix, on_attribute=None):
@@ -149,26 +165,57 @@ def _geom_predicate_query(left_df, right_df, predicate, distance,
 
     Returns
     -------
-    DataFrame
-        DataFrame with matching indices in
-        columns named `_key_left` and `_key_right`.
+    tuple of ndarray
+        Integer indices of the matching rows of `left_df` and `right_df`.
     """
-    left_sindex = left_df.sindex
-    right_geom = right_df.geometry
-
-    if predicate == 'dwithin':
-        if distance is None:
-            raise ValueError("Distance must be provided for 'dwithin' predicate")
-        matches = left_sindex.query(right_geom, predicate=predicate, distance=distance)
+    left_geoms = np.asarray(left_df.geometry.values)
+    type_ids = shapely.get_type_id(left_geoms)
+    if predicate in ('intersects', 'within') and len(left_geoms) and (
+            type_ids <= 0).all():
+        # point-in-polygon: shortlist the candidates using the bounding boxes
+        # of the spatial index, then test the point coordinates directly
+        # (missing or empty points never match the bounding box query, so
+        # the coordinates are only read from the candidates)
+        l_idx, r_idx = right_df.sindex.query(left_geoms, sort=False)
+        right_geoms = np.asarray(right_df.geometry.values)[r_idx]
+        candidates = left_geoms[l_idx]
+        x = shapely.get_x(candidates)
+        y = shapely.get_y(candidates)
+        if predicate == 'within':
+            keep = shapely.contains_xy(right_geoms, x, y)
+        else:
+            keep = shapely.intersects_xy(right_geoms, x, y)
+        l_idx = l_idx[keep]
+        r_idx = r_idx[keep]
     else:
-        matches = left_sindex.query(right_geom, predicate=predicate)
+        original_predicate = predicate
+        if predicate == 'within':
+            # within is implemented as the inverse of contains
+            predicate = 'contains'
+            sindex = left_df.sindex
+            input_geoms = right_df.geometry
+        else:
+            # all other predicates are symmetric
+            sindex = right_df.sindex
+            input_geoms = left_df.geometry
+
+        if predicate == 'dwithin' and distance is None:
+            raise ValueError("Distance must be provided for 'dwithin' predicate")
+        l_idx, r_idx = sindex.query(input_geoms, predicate=predicate, sort=
+            False, distance=distance)
 
-    left_idx, right_idx = matches
+        if original_predicate == 'within':
+            # flip back the results
+            r_idx, l_idx = l_idx, r_idx
+            indexer = np.lexsort((r_idx, l_idx))
+            l_idx = l_idx[indexer]
+            r_idx = r_idx[indexer]
 
     if on_attribute:
-        left_idx, right_idx = _filter_shared_attribute(left_df, right_df, left_idx, right_idx, on_attribute)
+        l_idx, r_idx, _ = _filter_shared_attribute(left_df, right_df,
+            l_idx, r_idx, on_attribute)
 
-    return pd.DataFrame({'_key_left': left_idx, '_key_right': right_idx})
+    return l_idx, r_idx
 
 
 def _reset_index_with_suffix(df, suffix, other):
@@ -176,18 +223,24 @@ def _reset_index_with_suffix(df, suffix, other):
     Equivalent of df.reset_index(), but with adding 'suffix' to auto-generated
     column names.
     """
-    df = df.reset_index()
-    if df.index.name:
-        df.index.name = f"{df.index.name}_{suffix}"
-    else:
-        df.index.name = f"index_{suffix}"
-
-    # Rename columns that conflict with the other DataFrame
-    for col in df.columns:
-        if col in other.columns:
-            df = df.rename(columns={col: f"{col}_{suffix}"})
-
-    return df
+    index_original = df.index.names
+    df_reset = df.reset_index()
+    rename = {}
+    for i, label in enumerate(index_original):
+        # if the original label was None, add suffix to auto-generated name
+        if label is None:
+            if df.index.nlevels > 1:
+                new_label = f"index_{suffix}{i}"
+            else:
+                new_label = f"index_{suffix}"
+            # check new label will not be in other dataframe
+            if new_label in df.columns or new_label in other.columns:
+                raise ValueError(
+                    f"'{new_label}' cannot be a column name in the frames being"
+                    " joined"
+                )
+            rename[df_reset.columns[i]] = new_label
+    return df_reset.rename(columns=rename)
 
 
 def _process_column_names_with_suffix(left: pd.Index, right: pd.Index,
@@ -229,10 +282,13 @@ def _restore_index(joined, index_names, index_names_original):
     Set back the the original index columns, and restoring their name as `None`
     if they didn't have a name originally.
     """
-    joined = joined.set_index(index_names)
+    joined = joined.set_index(list(index_names))
+    # restore the fact that the index didn't have a name
+    joined_index_names = list(joined.index.names)
     for i, name in enumerate(index_names_original):
         if name is None:
-            joined.index.names[i] = None
+            joined_index_names[i] = None
+    joined.index.names = joined_index_names
     return joined
 
 
@@ -291,42 +347,61 @@ def _frame_join(left_df, right_df, indices, distances, how, lsuffix,
     GeoDataFrame
         Joined GeoDataFrame.
     """
-    left_index, right_index = indices
+    original_length = len(right_df) if how == 'right' else len(left_df)
+    left_index, right_index, distances = _adjust_indexers(indices,
+        distances, original_length, how, predicate)
 
-    # Prepare DataFrames for join
-    left = left_df.iloc[left_index].copy()
-    right = right_df.iloc[right_index].copy()
+    if on_attribute:
+        # avoid duplicating the shared column
+        right_df = right_df.drop(columns=on_attribute)
 
-    # Add distance column if provided
-    if distances is not None:
-        right['_distance'] = distances
+    # Move the index labels to columns ('index_<suffix>' if unnamed), so
+    # that the frames can be taken positionally (the index labels may not be
+    # unique) and the index of the other side is kept as column
+    left_index_original = list(left_df.index.names)
+    right_index_original = list(right_df.index.names)
+    left_df = _reset_index_with_suffix(left_df, lsuffix, right_df)
+    right_df = _reset_index_with_suffix(right_df, rsuffix, left_df)
 
     # Rename conflicting columns
-    rename_dict = _process_column_names_with_suffix(left.columns, right.columns, (lsuffix, rsuffix), left_df, right_df)
-    left = left.rename(columns=rename_dict['left'])
-    right = right.rename(columns=rename_dict['right'])
+    rename_dict = _process_column_names_with_suffix(left_df.columns,
+        right_df.columns, (f'_{lsuffix}', f'_{rsuffix}'), left_df, right_df)
+    left_index_names = [rename_dict['left'].get(name, name)
+        for name in left_df.columns[:len(left_index_original)]]
+    right_index_names = [rename_dict['right'].get(name, name)
+        for name in right_df.columns[:len(right_index_original)]]
+
+    if how == 'right':
+        geometry = right_df._geometry_column_name
+        left_df = left_df.drop(columns=left_df._geometry_column_name)
+    else:
+        geometry = left_df._geometry_column_name
+        right_df = right_df.drop(columns=right_df._geometry_column_name)
+    left_df = left_df.rename(columns=rename_dict['left'])
+    right_df = right_df.rename(columns=rename_dict['right'])
+
+    # Assemble the result with a positional take on both sides and a single
+    # concat. `take` does not allow introducing missing rows with -1 indices
+    # (left/right joins), therefore _reindex_with_indexers is used instead
+    new_index = pd.RangeIndex(len(left_index))
+    left = left_df._reindex_with_indexers({0: (new_index, left_index)})
+    right = right_df._reindex_with_indexers({0: (new_index, right_index)})
+    if PANDAS_GE_30:
+        kwargs = {}
+    else:
+        kwargs = dict(copy=False)
+    joined = pd.concat([left, right], axis=1, **kwargs)
 
-    # Perform join
-    if how == 'left':
-        joined = left.join(right, how='left', lsuffix=lsuffix, rsuffix=rsuffix)
-    elif how == 'right':
-        joined = right.join(left, how='left', lsuffix=rsuffix, rsuffix=lsuffix)
-    else:  # inner
-        joined = left.join(right, how='inner', lsuffix=lsuffix, rsuffix=rsuffix)
+    # Add distance column if provided
+    if distances is not None:
+        joined['_distance'] = distances
 
     # Restore original index
-    if how in ('left', 'inner'):
-        joined.index = left_df.index[left_index]
-    else:  # right
-        joined.index = right_df.index[right_index]
-
-    # Set geometry column
-    if how in ('left', 'inner'):
-        joined.set_geometry(left_df._geometry_column_name, inplace=True)
-    else:  # right
-        joined.set_geometry(right_df._geometry_column_name, inplace=True)
-
-    return joined
+    if how == 'right':
+        joined = _restore_index(joined, right_index_names, right_index_original)
+    else:
+        joined = _restore_index(joined, left_index_names, left_index_original)
+    return GeoDataFrame(joined, geometry=geometry, copy=False)
 
 
 def _filter_shared_attribute(left_df, right_df, l_idx, r_idx, attribute):
@@ -335,7 +410,14 @@ def _filter_shared_attribute(left_df, right_df, l_idx, r_idx, attribute):
     in the attribute column. Also returns a Boolean `shared_attribute_rows` for rows
     with the same entry.
     """
-    pass
+    shared_attribute_rows = np.ones(len(l_idx), dtype=bool)
+    for attr in attribute:
+        left_values = left_df[attr].to_numpy()[l_idx]
+        right_values = right_df[attr].to_numpy()[r_idx]
+        shared_attribute_rows &= left_values == right_values
+    l_idx = l_idx[shared_attribute_rows]
+    r_idx = r_idx[shared_attribute_rows]
+    return l_idx, r_idx, shared_attribute_rows
 
 
 def sjoin_nearest(left_df: GeoDataFrame, right_df: GeoDataFrame, how: str=
@@ -1,4 +1,5 @@
 """Tests for the clip module."""
+import warnings
 import numpy as np
 import pandas as pd
 import shapely
@@ -194,6 +195,35 @@ def test_non_overlapping_geoms():
     assert clipped.empty
 
 
+def test_invalid_mask_non_overlapping():
+    """An invalid mask raises a TypeError, also if it is outside the input"""
+    points = GeoDataFrame({'geometry': [Point(0, 0), Point(1, 1)]}, crs="EPSG:4326")
+    with pytest.raises(TypeError, match="'mask' should be GeoDataFrame"):
+        clip(points, Point(10, 10))
+    with pytest.raises(TypeError, match="must have four values"):
+        clip(points, (10, 10, 20))
+
+
+@pytest.mark.skipif(not HAS_PYPROJ, reason="pyproj not installed")
+def test_crs_mismatch_non_overlapping():
+    """A CRS mismatch warns, also if the mask is outside the input"""
+    points = GeoDataFrame({'geometry': [Point(0, 0), Point(1, 1)]}, crs="EPSG:4326")
+    mask = GeoDataFrame(geometry=[box(10, 10, 20, 20)], crs="EPSG:3857")
+    with pytest.warns(UserWarning, match="CRS mismatch between the CRS"):
+        clipped = clip(points, mask)
+    assert clipped.empty
+
+
+def test_no_crs_no_warning():
+    """Two inputs without a CRS do not raise a CRS mismatch warning"""
+    points = GeoDataFrame({'geometry': [Point(0, 0), Point(1, 1)]})
+    mask = GeoDataFrame(geometry=[box(10, 10, 20, 20)])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        clipped = clip(points, mask)
+    assert clipped.empty
+
+
 @pytest.mark.parametrize('mask_fixture_name', mask_variants_single_rectangle)
 class TestClipWithSingleRectangleGdf:
 
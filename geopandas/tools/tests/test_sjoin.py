@@ -37,6 +37,75 @@ class TestSpatialJoin:
         })
         assert_geodataframe_equal(result, expected)
 
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right'])
+    def test_overlapping_column_names(self, how):
+        left_gdf = GeoDataFrame({
+            'geometry': [Point(0.5, 0.5), Point(5, 5)],
+            'name': ['a', 'b']
+        })
+        right_gdf = GeoDataFrame({
+            'geometry': [box(0, 0, 1, 1)],
+            'name': ['c']
+        })
+
+        result = sjoin(left_gdf, right_gdf, how=how)
+
+        assert 'name' not in result.columns
+        assert result['name_left'].iloc[0] == 'a'
+        assert result['name_right'].iloc[0] == 'c'
+        if how == 'right':
+            assert result['index_left'].tolist() == [0]
+        else:
+            assert result['index_right'].iloc[0] == 0
+
+    def test_on_attribute(self):
+        left_gdf = GeoDataFrame({
+            'geometry': [Point(0.5, 0.5), Point(0.6, 0.6), Point(5, 5)],
+            'kind': ['a', 'b', 'a'],
+            'value': [1, 2, 3]
+        })
+        right_gdf = GeoDataFrame({
+            'geometry': [box(0, 0, 1, 1), box(0, 0, 1, 1)],
+            'kind': ['a', 'c'],
+            'attr': ['A', 'C']
+        })
+
+        result = sjoin(left_gdf, right_gdf, on_attribute=['kind'])
+        expected = GeoDataFrame({
+            'geometry': [Point(0.5, 0.5)],
+            'kind': ['a'],
+            'value': [1],
+            'index_right': [0],
+            'attr': ['A']
+        })
+        assert_geodataframe_equal(result, expected)
+
+        result = sjoin(left_gdf, right_gdf, how='left', on_attribute='kind')
+        assert list(result.columns) == [
+            'geometry', 'kind', 'value', 'index_right', 'attr'
+        ]
+        assert result['attr'].tolist()[0] == 'A'
+        assert result['attr'].iloc[1:].isna().all()
+
+    @pytest.mark.parametrize('predicate', ['intersects', 'within'])
+    def test_points_empty_missing_and_boundary(self, predicate):
+        left_gdf = GeoDataFrame(
+            {'value': [1, 2, 3, 4, 5]},
+            geometry=[Point(0.5, 0.5), Point(), None, Point(1, 0.5),
+                      Point(1, 1)],
+        )
+        right_gdf = GeoDataFrame({'attr': ['A']}, geometry=[box(0, 0, 1, 1)])
+
+        result = sjoin(left_gdf, right_gdf, how='left', predicate=predicate)
+
+        matched = result.loc[result['attr'].notna(), 'value'].tolist()
+        if predicate == 'within':
+            # points on the boundary are not within the polygon
+            assert matched == [1]
+        else:
+            assert sorted(matched) == [1, 4, 5]
+        assert sorted(result['value']) == [1, 2, 3, 4, 5]
+
 
 class TestIndexNames:
     def test_index_names(self):
@@ -53,10 +122,38 @@ class TestIndexNames:
         # Perform spatial join
         result = sjoin(left_gdf, right_gdf, how='left', predicate='intersects')
 
-        # Assert the result
+        # Assert the result: the names of both indexes are preserved
         assert result.index.name == 'left_idx'
-        assert 'index_right' in result.columns
-        assert_series_equal(result['index_right'], pd.Series(['x', 'x'], name='index_right', index=['a', 'b']))
+        assert 'index_right' not in result.columns
+        assert_series_equal(result['right_idx'], pd.Series(['x', 'x'], name='right_idx', index=pd.Index(['a', 'b'], name='left_idx')))
+
+        result = sjoin(left_gdf, right_gdf, how='right', predicate='intersects')
+        assert result.index.name == 'right_idx'
+        assert result['left_idx'].tolist() == ['a', 'b']
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right'])
+    def test_duplicate_index(self, how):
+        left_gdf = GeoDataFrame({
+            'geometry': [Point(0.5, 0.5), Point(5, 5), Point(0.6, 0.6)],
+            'value': [1, 2, 3]
+        }, index=[0, 0, 1])
+        right_gdf = GeoDataFrame({
+            'geometry': [box(0, 0, 1, 1), box(4, 4, 6, 6)],
+            'attr': ['A', 'B']
+        }, index=[7, 7])
+
+        result = sjoin(left_gdf, right_gdf, how=how)
+
+        if how == 'right':
+            assert result.index.tolist() == [7, 7, 7]
+            assert sorted(zip(result['index_left'], result['value'])) == [
+                (0, 1), (0, 2), (1, 3)
+            ]
+        else:
+            assert result.index.tolist() == [0, 0, 1]
+            assert result['index_right'].tolist() == [7, 7, 7]
+            assert result['attr'].tolist() == ['A', 'B', 'A']
+        assert result.index.name is None
 
 
 @pytest.mark.usefixtures('_setup_class_nybb_filename')